@@ -6,9 +6,11 @@ into the format expected by the Program Nova dashboard.
 
 import json
 import subprocess
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
 from program_nova.dashboard.rollup import compute_hierarchy_rollups
+from program_nova.engine import json_codec
 
 
 def map_bead_status(status: str) -> str:
@@ -30,6 +32,34 @@ def map_bead_status(status: str) -> str:
     return status_map.get(status, "pending")
 
 
+def run_bd_json(args: List[str]) -> Any:
+    """Run a bd query and decode its JSON output.
+
+    The output is kept as bytes and decoded by the JSON parser in one pass
+    rather than first being decoded to a str.
+
+    Args:
+        args: bd subcommand and arguments (``--json`` is appended)
+
+    Returns:
+        Decoded JSON payload
+
+    Raises:
+        subprocess.CalledProcessError: If bd exits non-zero (stderr is text)
+        json.JSONDecodeError: If the output isn't valid JSON
+    """
+    command = ["bd", *args, "--json"]
+    result = subprocess.run(command, capture_output=True)
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode,
+            command,
+            output=result.stdout,
+            stderr=result.stderr.decode(errors="replace"),
+        )
+    return json_codec.loads(result.stdout)
+
+
 def parse_metrics_from_comments(bead_id: str) -> dict:
     """Extract metrics JSON from bead comments.
 
@@ -43,20 +73,39 @@ def parse_metrics_from_comments(bead_id: str) -> dict:
         Dictionary with metrics (token_usage, cost_usd, duration_seconds)
         or empty dict if no metrics comment found
     """
-    # Get comments for this bead
+    # Get comments for this bead; the JSON is decoded straight from bytes
     result = subprocess.run(
         ["bd", "comments", bead_id, "--json"],
-        capture_output=True,
-        text=True
+        capture_output=True
     )
 
     if result.returncode != 0:
         return {}
 
+    metrics = _metrics_from_comments_json(result.stdout)
+    if metrics is None:
+        return {}
+    # The cached dict is shared between calls; hand out a copy
+    return {**metrics, "token_usage": dict(metrics["token_usage"])}
+
+
+@lru_cache(maxsize=256)
+def _metrics_from_comments_json(payload: bytes) -> Optional[dict]:
+    """Find the metrics comment in `bd comments --json` output.
+
+    Cached on the raw output: the dashboard polls every bead's comments,
+    and those of finished beads don't change between polls.
+
+    Args:
+        payload: Raw stdout of `bd comments --json`
+
+    Returns:
+        Metrics dict, or None if the output has no metrics comment
+    """
     try:
-        comments = json.loads(result.stdout)
+        comments = json_codec.loads(payload)
     except json.JSONDecodeError:
-        return {}
+        return None
 
     # Find comment with type='metrics'
     for comment in comments:
@@ -65,7 +114,7 @@ def parse_metrics_from_comments(bead_id: str) -> dict:
             continue
 
         try:
-            data = json.loads(text)
+            data = json_codec.loads(text)
             if data.get("type") == "metrics":
                 # Return metrics data (excluding 'type' field for backward compat)
                 return {
@@ -76,7 +125,7 @@ def parse_metrics_from_comments(bead_id: str) -> dict:
         except json.JSONDecodeError:
             continue
 
-    return {}
+    return None
 
 
 def get_epic_status(epic_id: str) -> dict:
@@ -97,13 +146,8 @@ def get_epic_status(epic_id: str) -> dict:
         - rollups: Computed rollups for L0, L1, L2
     """
     # Get graph with layout
-    result = subprocess.run(
-        ["bd", "graph", epic_id, "--json"],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    graph = json.loads(result.stdout)
+    graph = run_bd_json(["graph", epic_id])
+    issues_by_id = {issue["id"]: issue for issue in graph["issues"]}
 
     # Build hierarchy from layers
     hierarchy: Dict[str, Dict[str, List[str]]] = {}
@@ -122,7 +166,7 @@ def get_epic_status(epic_id: str) -> dict:
             hierarchy[layer_name]["All"].append(bead_id)
 
             # Find bead in issues
-            bead = next((i for i in graph["issues"] if i["id"] == bead_id), None)
+            bead = issues_by_id.get(bead_id)
             if not bead:
                 continue
 
@@ -6,29 +6,39 @@ Provides API endpoints for:
 - /api/tasks/{task_id}/logs: Task log files
 - /api/beads/epics: List available bead epics
 - /api/beads/start: Start epic execution
+- /api/beads/stop: Stop a running epic
 - /api/beads/status/{epic_id}: Get epic status in dashboard format
 """
 
+import gzip
+import hashlib
 import json
 import logging
+import logging.handlers
+import mimetypes
+import queue
 import subprocess
 import threading
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
 
 from program_nova.engine.parser import parse_cascade
 from program_nova.engine.state import StateManager
 from program_nova.engine.bead_orchestrator import BeadOrchestrator
 from program_nova.dashboard.rollup import compute_hierarchy_rollups
 from program_nova.dashboard.milestones import MilestoneEvaluator
-from program_nova.dashboard.beads_adapter import get_epic_status
+from program_nova.dashboard.beads_adapter import get_epic_status, run_bd_json
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
@@ -42,11 +52,126 @@ NEXTJS_OUT_DIR = Path(__file__).parent / "nextjs" / "out"
 STATIC_DIR = NEXTJS_OUT_DIR if NEXTJS_OUT_DIR.exists() else Path(__file__).parent / "static"
 
 
+@dataclass(frozen=True)
+class StaticAsset:
+    """A static file held in memory alongside its gzip-compressed form."""
+    content: bytes
+    compressed: bytes
+    media_type: str
+    etag: str
+
+
+def _load_static_assets(static_dir: Path, url_prefix: str = "/static") -> Dict[str, StaticAsset]:
+    """Read, hash and gzip every file under a static directory once.
+
+    Static assets don't change while the server runs, so compression and
+    ETag hashing happen at startup instead of on every request.
+
+    Args:
+        static_dir: Directory being served
+        url_prefix: URL path the directory is served under
+
+    Returns:
+        Dict mapping request path to its StaticAsset
+    """
+    assets = {}
+    for path in static_dir.rglob("*"):
+        if path.is_file():
+            content = path.read_bytes()
+            digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+            media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            url_path = f"{url_prefix}/{path.relative_to(static_dir).as_posix()}"
+            assets[url_path] = StaticAsset(
+                content=content,
+                compressed=gzip.compress(content, compresslevel=9),
+                media_type=media_type,
+                etag=f'"{digest}"',
+            )
+    return assets
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows a gzip response.
+
+    Honours q-values, so "gzip;q=0" is a refusal, and falls back to a "*"
+    entry when gzip isn't listed.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+
+    Returns:
+        True if gzip has a non-zero quality
+    """
+    qualities = {}
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    quality = qualities.get("gzip", qualities.get("*", 0.0))
+    return quality > 0
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Uses weak comparison, as If-None-Match requires, so W/"..." tags from
+    the client match too; "*" matches any tag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Strong ETag of the current representation
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+class QualityGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that honours Accept-Encoding q-values.
+
+    The stock middleware compresses whenever "gzip" appears anywhere in the
+    header, including "gzip;q=0".
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not _accepts_gzip(
+            Headers(scope=scope).get("accept-encoding", "")
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 class StartEpicRequest(BaseModel):
     """Request model for starting epic execution."""
     epic_id: str
 
 
+class StopEpicRequest(BaseModel):
+    """Request model for stopping epic execution."""
+    epic_id: str
+
+
 def create_app(
     state_file: str = "./cascade_state.json",
     cascade_file: str = "./CASCADE.md",
@@ -90,8 +215,13 @@ def create_app(
         allow_headers=["*"],
     )
 
+    # Compress JSON and static responses; small payloads aren't worth it
+    app.add_middleware(QualityGZipMiddleware, minimum_size=500)
+
     # Initialize app state
     app.state.state_file = state_file
+    # Shared across requests so unchanged state isn't re-parsed on every poll
+    app.state.state_mgr = StateManager(state_file, cache_reads=True)
     app.state.cascade_file = cascade_file
     app.state.milestones_file = milestones_file
     app.state.milestone_evaluator = MilestoneEvaluator(milestones_file)
@@ -109,15 +239,34 @@ def create_app(
             if next_assets.exists():
                 app.mount("/_next", StaticFiles(directory=str(next_assets)), name="next_assets")
         else:
-            # Legacy: mount static directory
-            app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+            # Legacy: serve static directory from precompressed in-memory copies
+            static_assets = _load_static_assets(static_dir)
+
+            @app.api_route("/static/{asset_path:path}", methods=["GET", "HEAD"])
+            async def static_file(asset_path: str, request: Request):
+                """Serve a static asset, gzipped when the client accepts it."""
+                asset = static_assets.get(f"/static/{asset_path}")
+                if asset is None:
+                    raise HTTPException(status_code=404, detail="Not Found")
+
+                headers = {"ETag": asset.etag, "Vary": "Accept-Encoding"}
+                if _etag_matches(request.headers.get("if-none-match", ""), asset.etag):
+                    return Response(status_code=304, headers=headers)
+
+                if _accepts_gzip(request.headers.get("accept-encoding", "")):
+                    headers["Content-Encoding"] = "gzip"
+                    return Response(asset.compressed, media_type=asset.media_type, headers=headers)
+                return Response(asset.content, media_type=asset.media_type, headers=headers)
+
+    # Read the dashboard HTML once; it doesn't change while the server runs
+    index_path = static_dir / "index.html"
+    index_html = index_path.read_bytes() if index_path.exists() else None
 
     @app.get("/")
     async def root():
         """Serve the dashboard HTML."""
-        index_path = static_dir / "index.html"
-        if index_path.exists():
-            return FileResponse(index_path)
+        if index_html is not None:
+            return Response(index_html, media_type="text/html")
         return {"status": "ok", "service": "Program Nova Dashboard"}
 
     @app.get("/api/status")
@@ -132,8 +281,7 @@ def create_app(
         """
         try:
             # Read current state
-            sm = StateManager(app.state.state_file)
-            state = sm.read_state()
+            state = await app.state.state_mgr.read_state_async()
 
             # Parse cascade for hierarchy
             cascade_data = parse_cascade(app.state.cascade_file)
@@ -180,8 +328,7 @@ def create_app(
             JSON with task details including status, duration, tokens, etc.
         """
         try:
-            sm = StateManager(app.state.state_file)
-            state = sm.read_state()
+            state = await app.state.state_mgr.read_state_async()
 
             if task_id not in state["tasks"]:
                 raise HTTPException(
@@ -223,13 +370,7 @@ def create_app(
             if "-" in task_id and any(c.isalpha() for c in task_id):
                 # Bead mode: fetch comments from bead
                 try:
-                    result = subprocess.run(
-                        ["bd", "comments", task_id, "--json"],
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    comments = json.loads(result.stdout)
+                    comments = run_bd_json(["comments", task_id])
 
                     # Format comments as log-like output
                     log_lines = []
@@ -302,13 +443,7 @@ def create_app(
         """
         logger.info("Epic list requested")
         try:
-            result = subprocess.run(
-                ["bd", "list", "--type=epic", "--json"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            epics = json.loads(result.stdout)
+            epics = run_bd_json(["list", "--type=epic"])
             logger.info(f"Epic list returned {len(epics)} epics")
             return epics
         except FileNotFoundError:
@@ -389,6 +524,35 @@ def create_app(
                 detail=f"Error starting epic: {str(e)}"
             )
 
+    @app.post("/api/beads/stop")
+    async def stop_epic(request: StopEpicRequest):
+        """Stop a running epic's orchestrator.
+
+        Signals the orchestrator to exit its loop; its background thread
+        removes it from app.state once it finishes.
+
+        Args:
+            request: Request containing epic_id
+
+        Returns:
+            JSON with status and epic_id
+        """
+        logger.info(f"Epic stop requested for epic_id={request.epic_id}")
+        orchestrator = app.state.orchestrators.get(request.epic_id)
+        if orchestrator is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No running orchestrator for epic: {request.epic_id}"
+            )
+
+        orchestrator.stop()
+        return JSONResponse(
+            content={
+                "status": "stopping",
+                "epic_id": request.epic_id
+            }
+        )
+
     @app.get("/api/beads/status/{epic_id}")
     async def get_epic_status_endpoint(epic_id: str):
         """Get status for bead mode in dashboard format.
@@ -420,21 +584,23 @@ def create_app(
     return app
 
 
+# Background thread writing daemon-mode log records to the log file
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging(daemon_mode: bool = False):
     """
     Setup logging configuration.
 
+    In daemon mode, records are handed to a queue and written to the
+    rotating log file by a background QueueListener, so request handlers
+    and the orchestrator thread never block on file writes.
+
     Args:
         daemon_mode: If True, configure logging for daemon mode (log to file)
                     If False, log to console
     """
-    import logging
-    import logging.handlers
-    from pathlib import Path
-
-    # Create logs directory if it doesn't exist (relative to cwd)
-    logs_dir = Path.cwd() / "logs"
-    logs_dir.mkdir(exist_ok=True)
+    global _log_listener
 
     # Configure root logger
     logger = logging.getLogger()
@@ -442,9 +608,13 @@ def setup_logging(daemon_mode: bool = False):
 
     # Clear any existing handlers
     logger.handlers.clear()
+    stop_logging()
 
     if daemon_mode:
-        # Daemon mode: log to file with rotation
+        # Daemon mode: log to file with rotation. Only this mode writes
+        # under logs/, so the directory (relative to cwd) is created here.
+        logs_dir = Path.cwd() / "logs"
+        logs_dir.mkdir(exist_ok=True)
         log_file = logs_dir / "dashboard.log"
         handler = logging.handlers.RotatingFileHandler(
             log_file,
@@ -454,6 +624,13 @@ def setup_logging(daemon_mode: bool = False):
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
+        handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, handler)
+        _log_listener.start()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        return logger
     else:
         # Interactive mode: log to console
         handler = logging.StreamHandler()
@@ -467,6 +644,17 @@ def setup_logging(daemon_mode: bool = False):
     return logger
 
 
+def stop_logging():
+    """Flush and stop the daemon-mode log writer thread, if running."""
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
 def main():
     """Run the dashboard server.
 
@@ -543,13 +731,16 @@ def main():
     log_level = "info" if not args.daemon else "warning"
 
     # Run server
-    uvicorn.run(
-        app,
-        host=args.host,
-        port=args.port,
-        log_level=log_level,
-        access_log=not args.daemon,  # Disable access log in daemon mode
-    )
+    try:
+        uvicorn.run(
+            app,
+            host=args.host,
+            port=args.port,
+            log_level=log_level,
+            access_log=not args.daemon,  # Disable access log in daemon mode
+        )
+    finally:
+        stop_logging()
 
 
 if __name__ == "__main__":
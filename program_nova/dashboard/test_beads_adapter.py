@@ -96,8 +96,7 @@ def test_parse_metrics_from_comments_valid(mock_run):
     # Verify it called bd comments correctly
     mock_run.assert_called_once_with(
         ["bd", "comments", "Nova-abc.1", "--json"],
-        capture_output=True,
-        text=True
+        capture_output=True
     )
 
     # Verify returned metrics (without 'type' field)
@@ -251,3 +250,36 @@ def test_get_epic_status_basic_structure(tmp_path, monkeypatch):
     assert result["task_definitions"]["Nova-abc.1"]["depends_on"] == []
     assert "Nova-abc.2" in result["task_definitions"]
     assert result["task_definitions"]["Nova-abc.2"]["depends_on"] == ["Nova-abc.1"]
+
+
+@patch("subprocess.run")
+def test_get_epic_status_reports_bd_errors(mock_run):
+    """Test that a failing bd graph raises CalledProcessError with text stderr."""
+    import subprocess
+
+    mock_run.return_value = Mock(returncode=1, stdout=b"", stderr=b"Epic not found")
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        get_epic_status("Nova-missing")
+
+    assert exc_info.value.stderr == "Epic not found"
+
+
+@patch("subprocess.run")
+def test_parse_metrics_from_comments_caches_unchanged_output(mock_run):
+    """Test that identical bd comments output is only decoded once."""
+    from program_nova.dashboard import beads_adapter
+
+    comments = [{"text": json.dumps({"type": "metrics", "token_usage": {"input_tokens": 7}})}]
+    mock_run.return_value = Mock(returncode=0, stdout=json.dumps(comments).encode())
+
+    with patch.object(beads_adapter.json_codec, "loads", wraps=beads_adapter.json_codec.loads) as mock_loads:
+        first = parse_metrics_from_comments("Nova-cache.1")
+        calls = mock_loads.call_count
+        second = parse_metrics_from_comments("Nova-cache.1")
+        assert mock_loads.call_count == calls
+
+    assert first == second
+    # Callers get their own copies of the cached result
+    first["token_usage"]["input_tokens"] = 0
+    assert parse_metrics_from_comments("Nova-cache.1")["token_usage"]["input_tokens"] == 7
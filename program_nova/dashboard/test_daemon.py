@@ -10,6 +10,7 @@ from pathlib import Path
 from unittest.mock import patch, Mock
 import pytest
 
+from program_nova.dashboard import server
 from program_nova.dashboard.server import setup_logging
 
 
@@ -31,6 +32,9 @@ class TestSetupLogging:
         # Check log level
         assert logger.level == logging.INFO
 
+        # Console logging doesn't touch the filesystem
+        assert not (tmp_path / "logs").exists()
+
     def test_setup_logging_daemon_mode(self, tmp_path, monkeypatch):
         """Test logging setup in daemon mode."""
         # Change to temp directory
@@ -38,10 +42,18 @@ class TestSetupLogging:
 
         logger = setup_logging(daemon_mode=True)
 
-        # Should have one handler (RotatingFileHandler)
+        # Should have one handler (QueueHandler feeding a RotatingFileHandler)
         assert len(logger.handlers) == 1
         handler = logger.handlers[0]
-        assert isinstance(handler, logging.handlers.RotatingFileHandler)
+        assert isinstance(handler, logging.handlers.QueueHandler)
+        listener = server._log_listener
+        assert listener is not None and listener._thread is not None
+        assert isinstance(listener.handlers[0], logging.handlers.RotatingFileHandler)
+
+        # Records reach the file once the listener is stopped (flushed)
+        logging.getLogger("test").info("hello from daemon mode")
+        server.stop_logging()
+        assert "hello from daemon mode" in (tmp_path / "logs" / "dashboard.log").read_text()
 
         # Check that logs directory was created
         logs_dir = tmp_path / "logs"
@@ -87,74 +99,48 @@ class TestSetupLogging:
         assert isinstance(logger.handlers[0], logging.StreamHandler)
 
 
+@pytest.fixture(scope="module")
+def help_result():
+    """Run the dashboard's --help once for all the flag checks."""
+    return subprocess.run(
+        [sys.executable, "-m", "program_nova.dashboard.server", "--help"],
+        capture_output=True,
+        text=True,
+    )
+
+
 class TestDashboardDaemonMode:
     """Tests for dashboard daemon mode execution."""
 
-    def test_dashboard_accepts_daemon_flag(self):
+    def test_dashboard_accepts_daemon_flag(self, help_result):
         """Test that dashboard accepts --daemon flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "program_nova.dashboard.server", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "--daemon" in result.stdout
+        assert help_result.returncode == 0
+        assert "--daemon" in help_result.stdout
 
-    def test_dashboard_accepts_host_flag(self):
+    def test_dashboard_accepts_host_flag(self, help_result):
         """Test that dashboard accepts --host flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "program_nova.dashboard.server", "--help"],
-            capture_output=True,
-            text=True,
-        )
+        assert help_result.returncode == 0
+        assert "--host" in help_result.stdout
 
-        assert result.returncode == 0
-        assert "--host" in result.stdout
-
-    def test_dashboard_accepts_port_flag(self):
+    def test_dashboard_accepts_port_flag(self, help_result):
         """Test that dashboard accepts --port flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "program_nova.dashboard.server", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "--port" in result.stdout
+        assert help_result.returncode == 0
+        assert "--port" in help_result.stdout
 
-    def test_dashboard_accepts_state_file_flag(self):
+    def test_dashboard_accepts_state_file_flag(self, help_result):
         """Test that dashboard accepts --state-file flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "program_nova.dashboard.server", "--help"],
-            capture_output=True,
-            text=True,
-        )
+        assert help_result.returncode == 0
+        assert "--state-file" in help_result.stdout
 
-        assert result.returncode == 0
-        assert "--state-file" in result.stdout
-
-    def test_dashboard_accepts_cascade_file_flag(self):
+    def test_dashboard_accepts_cascade_file_flag(self, help_result):
         """Test that dashboard accepts --cascade-file flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "program_nova.dashboard.server", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "--cascade-file" in result.stdout
+        assert help_result.returncode == 0
+        assert "--cascade-file" in help_result.stdout
 
-    def test_dashboard_accepts_milestones_file_flag(self):
+    def test_dashboard_accepts_milestones_file_flag(self, help_result):
         """Test that dashboard accepts --milestones-file flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "program_nova.dashboard.server", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "--milestones-file" in result.stdout
+        assert help_result.returncode == 0
+        assert "--milestones-file" in help_result.stdout
 
 
 if __name__ == "__main__":
@@ -12,20 +12,7 @@ from program_nova.dashboard.server import create_app
 from program_nova.engine.state import StateManager, TaskStatus
 
 
-@pytest.fixture
-def temp_state_file():
-    """Create a temporary state file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        temp_path = f.name
-    yield temp_path
-    # Cleanup
-    Path(temp_path).unlink(missing_ok=True)
-
-
-@pytest.fixture
-def temp_cascade_file():
-    """Create a temporary CASCADE.md file for testing."""
-    cascade_content = """# Test Project
+CASCADE_CONTENT = """# Test Project
 
 ## L1: Application
 
@@ -40,21 +27,20 @@ def temp_cascade_file():
 |---------|-----------|--------------|------------|
 | P1 | Provider Interface | Define provider | F1 |
 """
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-        f.write(cascade_content)
-        temp_path = f.name
-    yield temp_path
-    # Cleanup
-    Path(temp_path).unlink(missing_ok=True)
 
 
-@pytest.fixture
-def initialized_state(temp_state_file, temp_cascade_file):
-    """Create an initialized state with some tasks."""
-    sm = StateManager(temp_state_file)
+@pytest.fixture(scope="session")
+def initial_state_blob(tmp_path_factory):
+    """Build the initialized state once and return its serialized bytes."""
+    seed_dir = tmp_path_factory.mktemp("seed")
+    state_file = seed_dir / "state.json"
+    cascade_file = seed_dir / "CASCADE.md"
+    cascade_file.write_text(CASCADE_CONTENT)
+
+    sm = StateManager(str(state_file))
     sm.initialize(
         project_name="Test Project",
-        cascade_file=temp_cascade_file
+        cascade_file=str(cascade_file)
     )
 
     # Add some tasks
@@ -94,7 +80,18 @@ def initialized_state(temp_state_file, temp_cascade_file):
         status=TaskStatus.PENDING,
     )
 
-    return temp_state_file, temp_cascade_file
+    return state_file.read_bytes()
+
+
+@pytest.fixture
+def initialized_state(tmp_path, initial_state_blob):
+    """Create an initialized state with some tasks."""
+    state_file = tmp_path / "state.json"
+    state_file.write_bytes(initial_state_blob)
+    cascade_file = tmp_path / "CASCADE.md"
+    cascade_file.write_text(CASCADE_CONTENT)
+
+    return str(state_file), str(cascade_file)
 
 
 @pytest.fixture
@@ -269,8 +266,9 @@ class TestBeadsEndpoints:
         assert data[1]["id"] == "Nova-epic2"
 
         # Verify logging occurred
-        assert any("epic list requested" in record.message.lower() for record in caplog.records)
-        assert any("2" in record.message for record in caplog.records)  # Count of epics
+        messages = "\n".join(record.message for record in caplog.records)
+        assert "epic list requested" in messages.lower()
+        assert "2" in messages  # Count of epics
 
     def test_start_epic_success(self, client, caplog):
         """POST /api/beads/start starts epic execution."""
@@ -288,8 +286,9 @@ class TestBeadsEndpoints:
         assert data["epic_id"] == "Nova-epic1"
 
         # Verify logging occurred
-        assert any("epic start requested" in record.message.lower() for record in caplog.records)
-        assert any("Nova-epic1" in record.message for record in caplog.records)
+        messages = "\n".join(record.message for record in caplog.records)
+        assert "epic start requested" in messages.lower()
+        assert "Nova-epic1" in messages
 
     def test_get_epic_status_success(self, client, monkeypatch, caplog):
         """GET /api/beads/status/{epic_id} returns epic status in dashboard format."""
@@ -409,8 +408,9 @@ class TestBeadsEndpoints:
         assert data["task_definitions"]["Nova-epic1.2"]["depends_on"] == ["Nova-epic1.1"]
 
         # Verify logging occurred
-        assert any("epic status queried" in record.message.lower() for record in caplog.records)
-        assert any("Nova-epic1" in record.message for record in caplog.records)
+        messages = "\n".join(record.message for record in caplog.records)
+        assert "epic status queried" in messages.lower()
+        assert "Nova-epic1" in messages
 
     def test_list_epics_error_logging(self, client, monkeypatch, caplog):
         """GET /api/beads/epics logs errors with full details."""
@@ -426,8 +426,10 @@ class TestBeadsEndpoints:
         assert response.status_code == 500
 
         # Verify error logging occurred
-        assert any(record.levelname == "ERROR" for record in caplog.records)
-        assert any("error listing epics" in record.message.lower() for record in caplog.records)
+        levels = {record.levelname for record in caplog.records}
+        messages = "\n".join(record.message for record in caplog.records).lower()
+        assert "ERROR" in levels
+        assert "error listing epics" in messages
 
     def test_get_epic_status_error_logging(self, client, monkeypatch, caplog):
         """GET /api/beads/status/{epic_id} logs errors with full details."""
@@ -443,8 +445,10 @@ class TestBeadsEndpoints:
         assert response.status_code == 500
 
         # Verify error logging occurred
-        assert any(record.levelname == "ERROR" for record in caplog.records)
-        assert any("error getting epic status" in record.message.lower() for record in caplog.records)
+        levels = {record.levelname for record in caplog.records}
+        messages = "\n".join(record.message for record in caplog.records).lower()
+        assert "ERROR" in levels
+        assert "error getting epic status" in messages
 
 
 class TestServerLifecycle:
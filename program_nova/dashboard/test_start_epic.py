@@ -4,63 +4,124 @@ This test verifies that the endpoint doesn't just return 200 OK,
 but actually instantiates and starts a BeadOrchestrator.
 """
 
-from unittest.mock import patch, MagicMock
+import threading
 
 import pytest
 from fastapi.testclient import TestClient
 
 from program_nova.dashboard.server import create_app
 
+ORCHESTRATOR_PATH = "program_nova.dashboard.server.BeadOrchestrator"
 
-@pytest.fixture
+
+class FakeOrchestrator:
+    """Minimal stand-in for BeadOrchestrator that records how it was used."""
+
+    instances = []
+
+    def __init__(self, epic_id):
+        self.epic_id = epic_id
+        self.started = threading.Event()
+        FakeOrchestrator.instances.append(self)
+
+    def start(self):
+        self.started.set()
+
+    def stop(self):
+        pass
+
+
+class BlockingOrchestrator(FakeOrchestrator):
+    """Stand-in whose start() runs until stop() is called."""
+
+    def __init__(self, epic_id):
+        super().__init__(epic_id)
+        self.stopped = threading.Event()
+
+    def start(self):
+        self.started.set()
+        self.stopped.wait(timeout=5.0)
+
+    def stop(self):
+        self.stopped.set()
+
+
+class FailingOrchestrator:
+    """Stand-in for BeadOrchestrator whose construction fails."""
+
+    def __init__(self, epic_id):
+        raise Exception("Failed to start orchestrator")
+
+
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the FastAPI app."""
+    """Create one test client shared by the module's tests."""
     app = create_app()
     return TestClient(app)
 
 
-def test_start_epic_instantiates_orchestrator(client):
+def test_start_epic_instantiates_orchestrator(client, monkeypatch):
     """POST /api/beads/start should instantiate and start BeadOrchestrator."""
     epic_id = "Nova-test-epic"
+    FakeOrchestrator.instances = []
+    monkeypatch.setattr(ORCHESTRATOR_PATH, FakeOrchestrator)
 
-    # Mock BeadOrchestrator class
-    with patch("program_nova.dashboard.server.BeadOrchestrator") as mock_orchestrator_class:
-        mock_orchestrator_instance = MagicMock()
-        mock_orchestrator_class.return_value = mock_orchestrator_instance
+    # Make the request
+    response = client.post(
+        "/api/beads/start",
+        json={"epic_id": epic_id}
+    )
 
-        # Make the request
-        response = client.post(
-            "/api/beads/start",
-            json={"epic_id": epic_id}
-        )
+    # Verify response
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "started"
+    assert data["epic_id"] == epic_id
 
-        # Verify response
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "started"
-        assert data["epic_id"] == epic_id
+    # Verify BeadOrchestrator was instantiated with epic_id
+    assert len(FakeOrchestrator.instances) == 1
+    orchestrator = FakeOrchestrator.instances[0]
+    assert orchestrator.epic_id == epic_id
 
-        # Verify BeadOrchestrator was instantiated with epic_id
-        mock_orchestrator_class.assert_called_once_with(epic_id)
+    # Verify start() method was called on the orchestrator
+    assert orchestrator.started.wait(timeout=1.0)
 
-        # Verify start() method was called on the orchestrator
-        mock_orchestrator_instance.start.assert_called_once()
 
-
-def test_start_epic_handles_orchestrator_errors(client):
+def test_start_epic_handles_orchestrator_errors(client, monkeypatch):
     """POST /api/beads/start should handle orchestrator errors gracefully."""
     epic_id = "Nova-test-epic"
+    monkeypatch.setattr(ORCHESTRATOR_PATH, FailingOrchestrator)
+
+    # Make the request
+    response = client.post(
+        "/api/beads/start",
+        json={"epic_id": epic_id}
+    )
+
+    # Should return 500 error
+    assert response.status_code == 500
+    assert "error" in response.json()["detail"].lower()
+
+
+def test_stop_epic_stops_running_orchestrator(client, monkeypatch):
+    """POST /api/beads/stop should call stop() on the running orchestrator."""
+    epic_id = "Nova-test-epic"
+    FakeOrchestrator.instances = []
+    monkeypatch.setattr(ORCHESTRATOR_PATH, BlockingOrchestrator)
+
+    client.post("/api/beads/start", json={"epic_id": epic_id})
+
+    orchestrator = FakeOrchestrator.instances[0]
+    assert orchestrator.started.wait(timeout=1.0)
+
+    response = client.post("/api/beads/stop", json={"epic_id": epic_id})
 
-    # Mock BeadOrchestrator to raise an exception
-    with patch("program_nova.dashboard.server.BeadOrchestrator") as mock_orchestrator_class:
-        mock_orchestrator_class.side_effect = Exception("Failed to start orchestrator")
+    assert response.status_code == 200
+    assert response.json()["status"] == "stopping"
+    assert orchestrator.stopped.is_set()
 
-        # Make the request
-        response = client.post(
-            "/api/beads/start",
-            json={"epic_id": epic_id}
-        )
 
-        # Should return 500 error
-        assert response.status_code == 500
-        assert "error" in response.json()["detail"].lower()
+def test_stop_epic_unknown_epic_returns_404(client):
+    """POST /api/beads/stop should 404 when no orchestrator is running."""
+    response = client.post("/api/beads/stop", json={"epic_id": "Nova-missing"})
+    assert response.status_code == 404
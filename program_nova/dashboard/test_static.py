@@ -1,17 +1,20 @@
 """Tests for static file serving."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 from fastapi.testclient import TestClient
 
-from program_nova.dashboard.server import create_app
+from program_nova.dashboard.server import _accepts_gzip, create_app
 from program_nova.engine.state import StateManager
 
 
-@pytest.fixture
-def cascade_file():
+@pytest.fixture(scope="module")
+def fixtures_dir(tmp_path_factory):
+    """Create a temporary directory shared by the module's fixture files."""
+    return tmp_path_factory.mktemp("static")
+
+
+@pytest.fixture(scope="module")
+def cascade_file(fixtures_dir):
     """Create a minimal CASCADE.md file for testing."""
     content = """# Test Project
 
@@ -22,55 +25,50 @@ def cascade_file():
 |---------|-----------|--------------|------------|
 | F1 | Core Types | Define base types | - |
 """
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-        f.write(content)
-        path = f.name
-    yield path
-    Path(path).unlink(missing_ok=True)
+    path = fixtures_dir / "CASCADE.md"
+    path.write_text(content)
+    return str(path)
 
 
-@pytest.fixture
-def state_file(cascade_file):
+@pytest.fixture(scope="module")
+def state_file(fixtures_dir, cascade_file):
     """Create a temporary state file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        path = f.name
+    path = str(fixtures_dir / "cascade_state.json")
 
     # Initialize the state
     sm = StateManager(path)
     sm.initialize("Test Project", cascade_file)
 
-    yield path
-    Path(path).unlink(missing_ok=True)
+    return path
 
 
-@pytest.fixture
-def milestones_file():
+@pytest.fixture(scope="module")
+def milestones_file(fixtures_dir):
     """Create a minimal milestones.yaml file for testing."""
     content = """milestones: []
 """
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        f.write(content)
-        path = f.name
-    yield path
-    Path(path).unlink(missing_ok=True)
+    path = fixtures_dir / "milestones.yaml"
+    path.write_text(content)
+    return str(path)
 
 
-def test_static_html_served(state_file, cascade_file, milestones_file):
-    """Test that the index.html file is served at the root."""
+@pytest.fixture(scope="module")
+def client(state_file, cascade_file, milestones_file):
+    """Create one test client shared by all static file tests."""
     app = create_app(state_file, cascade_file, milestones_file)
-    client = TestClient(app)
+    return TestClient(app)
+
 
+def test_static_html_served(client):
+    """Test that the index.html file is served at the root."""
     response = client.get("/")
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
     assert b"Program Nova Dashboard" in response.content
 
 
-def test_static_css_accessible(state_file, cascade_file, milestones_file):
+def test_static_css_accessible(client):
     """Test that CSS file is accessible (legacy or Next.js mode)."""
-    app = create_app(state_file, cascade_file, milestones_file)
-    client = TestClient(app)
-
     # Check legacy static path first
     response = client.get("/static/styles.css")
     if response.status_code == 200:
@@ -84,11 +82,8 @@ def test_static_css_accessible(state_file, cascade_file, milestones_file):
         assert "text/html" in root_response.headers["content-type"]
 
 
-def test_static_js_accessible(state_file, cascade_file, milestones_file):
+def test_static_js_accessible(client):
     """Test that JS file is accessible (legacy or Next.js mode)."""
-    app = create_app(state_file, cascade_file, milestones_file)
-    client = TestClient(app)
-
     # Check legacy static path first
     response = client.get("/static/app.js")
     if response.status_code == 200:
@@ -102,11 +97,8 @@ def test_static_js_accessible(state_file, cascade_file, milestones_file):
         assert "text/html" in root_response.headers["content-type"]
 
 
-def test_api_and_static_coexist(state_file, cascade_file, milestones_file):
+def test_api_and_static_coexist(client):
     """Test that API endpoints and static files can coexist."""
-    app = create_app(state_file, cascade_file, milestones_file)
-    client = TestClient(app)
-
     # Test API endpoint
     api_response = client.get("/api/status")
     assert api_response.status_code == 200
@@ -116,3 +108,68 @@ def test_api_and_static_coexist(state_file, cascade_file, milestones_file):
     static_response = client.get("/")
     assert static_response.status_code == 200
     assert "text/html" in static_response.headers["content-type"]
+
+
+def test_static_etag_revalidation(client):
+    """Test that static assets carry an ETag and revalidate with 304."""
+    response = client.get("/static/styles.css")
+    if response.status_code != 200:
+        pytest.skip("Legacy static directory not mounted")
+
+    etag = response.headers["etag"]
+    revalidated = client.get("/static/styles.css", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    # Weak tags from caches and proxies revalidate too
+    weak = client.get("/static/styles.css", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert weak.status_code == 304
+
+
+def test_static_served_precompressed(client):
+    """Test that static assets are gzipped only when the client accepts it."""
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    if response.status_code != 200:
+        pytest.skip("Legacy static directory not mounted")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "javascript" in response.headers["content-type"]
+
+    plain = client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.content == response.content
+
+
+def test_static_head_request(client):
+    """Test that static assets answer HEAD requests with GET's headers."""
+    response = client.get("/static/app.js")
+    if response.status_code != 200:
+        pytest.skip("Legacy static directory not mounted")
+
+    head = client.head("/static/app.js")
+    assert head.status_code == 200
+    assert head.headers["etag"] == response.headers["etag"]
+    assert head.headers["content-type"] == response.headers["content-type"]
+
+
+@pytest.mark.parametrize("header,expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("deflate, GZIP;q=0.5", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.0, identity", False),
+    ("*", True),
+    ("*;q=0", False),
+    ("identity", False),
+    ("", False),
+])
+def test_accepts_gzip(header, expected):
+    """Test that Accept-Encoding q-values are honoured."""
+    assert _accepts_gzip(header) is expected
+
+
+def test_static_gzip_refused_with_zero_quality(client):
+    """Test that gzip;q=0 gets the uncompressed asset."""
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    if response.status_code != 200:
+        pytest.skip("Legacy static directory not mounted")
+    assert "content-encoding" not in response.headers
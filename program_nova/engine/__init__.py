@@ -4,9 +4,32 @@ Program Nova - Execution Engine
 This module contains the core execution engine components for Program Nova,
 which orchestrates Claude Code agents to complete tasks defined in a cascade file
 or from a bead epic.
+
+Public names are imported lazily on first access, so importing a single
+submodule doesn't pull in the rest of the engine.
 """
 
-from .worker import Worker, WorkerStatus
-from .bead_orchestrator import BeadOrchestrator, compute_cost_from_tokens
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "Worker": ".worker",
+    "WorkerStatus": ".worker",
+    "BeadOrchestrator": ".bead_orchestrator",
+    "compute_cost_from_tokens": ".bead_orchestrator",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["Worker", "WorkerStatus", "BeadOrchestrator", "compute_cost_from_tokens"]
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -4,21 +4,30 @@ Bead Orchestrator for Program Nova execution engine.
 Uses beads as task source instead of CASCADE.md file.
 Main responsibilities:
 1. Query bead graph to get task dependencies
-2. Identify ready tasks using bd ready
+2. Identify ready tasks using bd ready, then track them locally
 3. Spawn workers for ready bead tasks
 4. Monitor worker progress and update bead status
 5. Store execution metrics as structured JSON comments
 6. Close beads when tasks complete
 """
 
-import json
+import logging
+import os
+import shlex
+import shutil
 import subprocess
 import threading
 import time
-from typing import Dict, List, Optional
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
+from program_nova.engine import json_codec
 from program_nova.engine.worker import Worker
 
+logger = logging.getLogger(__name__)
 
 # Pricing for Sonnet 4.5 (per million tokens)
 PRICE_INPUT_TOKENS = 3.00
@@ -26,6 +35,12 @@ PRICE_OUTPUT_TOKENS = 15.00
 PRICE_CACHE_READ_TOKENS = 0.30
 PRICE_CACHE_CREATION_TOKENS = 3.75
 
+# Per-token prices, scaled once at import time
+_INPUT_PER_TOKEN = PRICE_INPUT_TOKENS / 1_000_000
+_OUTPUT_PER_TOKEN = PRICE_OUTPUT_TOKENS / 1_000_000
+_CACHE_READ_PER_TOKEN = PRICE_CACHE_READ_TOKENS / 1_000_000
+_CACHE_CREATION_PER_TOKEN = PRICE_CACHE_CREATION_TOKENS / 1_000_000
+
 
 def compute_cost_from_tokens(token_usage: Dict[str, int]) -> float:
     """
@@ -38,13 +53,53 @@ def compute_cost_from_tokens(token_usage: Dict[str, int]) -> float:
     Returns:
         Cost in USD
     """
-    cost_usd = (
-        token_usage.get("input_tokens", 0) / 1_000_000 * PRICE_INPUT_TOKENS
-        + token_usage.get("output_tokens", 0) / 1_000_000 * PRICE_OUTPUT_TOKENS
-        + token_usage.get("cache_read_tokens", 0) / 1_000_000 * PRICE_CACHE_READ_TOKENS
-        + token_usage.get("cache_creation_tokens", 0) / 1_000_000 * PRICE_CACHE_CREATION_TOKENS
+    get = token_usage.get
+    return (
+        get("input_tokens", 0) * _INPUT_PER_TOKEN
+        + get("output_tokens", 0) * _OUTPUT_PER_TOKEN
+        + get("cache_read_tokens", 0) * _CACHE_READ_PER_TOKEN
+        + get("cache_creation_tokens", 0) * _CACHE_CREATION_PER_TOKEN
     )
-    return cost_usd
+
+
+@lru_cache(maxsize=None)
+def _spawn_options(program: str) -> Dict[str, object]:
+    """
+    Popen options that let subprocess start program with posix_spawn().
+
+    subprocess only takes the posix_spawn() fast path when close_fds is
+    False and the executable is given as a path, so the program is looked
+    up on PATH once here. Leaving fds open is safe: Python creates its own
+    fds non-inheritable, so the child only sees stdin/stdout/stderr.
+
+    Args:
+        program: Name of the program to run (e.g. ``bd``)
+
+    Returns:
+        Keyword arguments for subprocess.run()/subprocess.Popen()
+    """
+    options: Dict[str, object] = {"close_fds": False}
+    path = shutil.which(program)
+    if path:
+        options["executable"] = path
+    return options
+
+
+def _find_beads_dir() -> Optional[Path]:
+    """Return the nearest .beads directory at or above the working directory."""
+    cwd = Path.cwd()
+    for directory in (cwd, *cwd.parents):
+        candidate = directory / ".beads"
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+@dataclass(slots=True)
+class _ActiveWorker:
+    """A running worker together with the time its task started."""
+    worker: Worker
+    start_time: float
 
 
 class BeadOrchestrator:
@@ -59,36 +114,262 @@ class BeadOrchestrator:
             max_workers: Maximum number of concurrent workers (default: 3)
         """
         self.epic_id = epic_id
+        # Child bead IDs are "<epic_id>.<n>"
+        self._child_prefix = epic_id + "."
         self.max_workers = max_workers
-        self.active_workers: Dict[str, Worker] = {}
-        self.task_start_times: Dict[str, float] = {}
+        # Running workers and their start times, keyed by bead_id
+        self.active: Dict[str, _ActiveWorker] = {}
         self.stop_flag = threading.Event()
+        # Set by stop() and by worker exits to wake the main loop early
+        self._wakeup = threading.Event()
+        # Task info from the last `bd graph` query, keyed by bead_id
+        self.tasks: Dict[str, dict] = {}
+        # Location of the bd store, used to notice when it has changed
+        self._beads_dir = _find_beads_dir()
+        # Locally tracked ready set, seeded from `bd ready` once and then
+        # updated as tasks complete (None until seeded)
+        self._ready: Optional[List[str]] = None
+        # Number of unmet in-epic dependencies per task, and the reverse index
+        self._pending_deps: Dict[str, int] = {}
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+        # Tasks whose readiness can't be decided locally (dependencies
+        # outside the epic, or not open themselves); when released they wait
+        # in _unverified until `bd ready` confirms them
+        self._needs_bd_check: Set[str] = set()
+        self._unverified: List[str] = []
+        # Store key at the last `bd ready` check of _unverified
+        self._verified_key: Optional[tuple] = None
+        # In-flight bd write commands as (bead_id, process) pairs
+        self._pending_writes: List[Tuple[str, subprocess.Popen]] = []
+
+    def _bd_json(self, *args: str):
+        """
+        Run a read-only bd query and decode its JSON output.
+
+        Args:
+            *args: bd subcommand and arguments (``--json`` is appended)
+
+        Returns:
+            Decoded JSON payload
+        """
+        result = subprocess.run(
+            ["bd", *args, "--json"],
+            capture_output=True,
+            **_spawn_options("bd")
+        )
+        return json_codec.loads(result.stdout)
+
+    def _spawn_write(self, bead_ids: List[str], command: List[str]):
+        """
+        Start a command that modifies beads without waiting for it.
+
+        Output is discarded; errors go to this process's stderr, and a
+        non-zero exit is logged once the command is reaped. Earlier writes
+        to the same beads are waited on first so that, e.g., a close never
+        overtakes the in_progress update.
+
+        Args:
+            bead_ids: IDs of the beads the command modifies
+            command: Command line to run
+        """
+        for pending_id, process in self._pending_writes:
+            if pending_id in bead_ids:
+                process.wait()
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            **_spawn_options(command[0])
+        )
+        self._pending_writes.extend((bead_id, process) for bead_id in bead_ids)
+
+    def _bd_write(self, bead_id: str, *args: str):
+        """
+        Run a bd command that modifies a bead without waiting for it.
+
+        Args:
+            bead_id: ID of the bead the command modifies
+            *args: bd subcommand and arguments
+        """
+        self._spawn_write([bead_id], ["bd", *args])
+
+    def _bd_write_sequence(self, bead_id: str, *commands: List[str]):
+        """
+        Run several bd commands for one bead, in order, as one background job.
+
+        Args:
+            bead_id: ID of the bead the commands modify
+            *commands: bd subcommands with their arguments
+        """
+        script = " ; ".join(shlex.join(["bd", *command]) for command in commands)
+        self._spawn_write([bead_id], ["sh", "-c", script])
+
+    @staticmethod
+    def _log_failed_writes(processes: List[subprocess.Popen]):
+        """
+        Log bd write commands that exited with an error.
+
+        The local ready set has already moved on as if the write landed, so
+        a failed close leaves bd and this orchestrator out of step.
+
+        Args:
+            processes: Finished write processes (duplicates are logged once)
+        """
+        for process in {id(process): process for process in processes}.values():
+            if process.returncode != 0:
+                logger.error(
+                    "bd write failed with exit code %s: %s",
+                    process.returncode, shlex.join(process.args),
+                )
+
+    def _reap_writes(self):
+        """Drop finished bd write commands from the pending list."""
+        pending, finished = [], []
+        for bead_id, process in self._pending_writes:
+            if process.poll() is None:
+                pending.append((bead_id, process))
+            else:
+                finished.append(process)
+        self._pending_writes = pending
+        self._log_failed_writes(finished)
+
+    def flush_writes(self):
+        """Wait for all in-flight bd write commands to finish."""
+        finished = []
+        for _, process in self._pending_writes:
+            process.wait()
+            finished.append(process)
+        self._pending_writes = []
+        self._log_failed_writes(finished)
+
+    def _store_key(self) -> Optional[tuple]:
+        """
+        Identify the current contents of the bd store by file metadata.
+
+        Returns:
+            (name, mtime_ns, size) of every file in the .beads directory, or
+            None if there is no store to check
+        """
+        if self._beads_dir is None:
+            return None
+        try:
+            with os.scandir(self._beads_dir) as entries:
+                key = []
+                for entry in entries:
+                    if entry.is_file():
+                        st = entry.stat()
+                        key.append((entry.name, st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            return None
+        return tuple(sorted(key))
 
     def get_tasks(self) -> Dict[str, dict]:
         """
         Get tasks from bead children.
 
+        The result is also kept on ``self.tasks`` so that ``start_worker``
+        can reuse the descriptions instead of issuing a ``bd show`` per task.
+
         Returns:
             Dictionary mapping bead_id to task info with keys:
             - description: Task description or title
             - depends_on: List of dependency bead IDs
+            - status: Bead status at query time
         """
-        result = subprocess.run(
-            ["bd", "graph", self.epic_id, "--json"],
-            capture_output=True,
-            text=True
-        )
-        graph = json.loads(result.stdout)
+        graph = self._bd_json("graph", self.epic_id)
+        issues = graph["issues"]
+        nodes = graph["layout"]["Nodes"]
+        # Only the extracted fields are kept; drop the rest of the payload
+        del graph
 
         tasks = {}
-        for issue in graph["issues"]:
+        for issue in issues:
             if issue["id"] != self.epic_id:  # Skip the epic itself
                 tasks[issue["id"]] = {
                     "description": issue.get("description") or issue["title"],
-                    "depends_on": graph["layout"]["Nodes"][issue["id"]].get("DependsOn") or []
+                    "depends_on": nodes[issue["id"]].get("DependsOn") or [],
+                    "status": issue.get("status"),
                 }
+        self.tasks = tasks
         return tasks
 
+    def _seed_ready_tasks(self) -> List[str]:
+        """
+        Load the graph and ready set once and index dependencies.
+
+        After seeding, the only thing that changes readiness is this
+        orchestrator closing a bead, so complete_task() updates the ready
+        set locally instead of re-running ``bd ready`` every iteration.
+        In-epic dependencies that are already closed count as met.
+
+        A task that depends on a bead outside the epic, or that isn't open
+        itself, is never released on local information alone: once its
+        in-epic dependencies close it waits for `bd ready` to confirm it
+        (see _verify_released()).
+
+        Returns:
+            List of bead IDs that are ready to start
+        """
+        self.get_tasks()
+
+        self._pending_deps = {}
+        self._dependents = defaultdict(set)
+        self._needs_bd_check = set()
+        self._unverified = []
+        for task_id, info in self.tasks.items():
+            deps = set()
+            for dep in info["depends_on"]:
+                if dep not in self.tasks:
+                    self._needs_bd_check.add(task_id)
+                elif self.tasks[dep]["status"] != "closed":
+                    deps.add(dep)
+            if info["status"] != "open":
+                self._needs_bd_check.add(task_id)
+            self._pending_deps[task_id] = len(deps)
+            for dep in deps:
+                self._dependents[dep].add(task_id)
+
+        self._ready = self.get_ready_tasks()
+        return self._ready
+
+    def _release_dependents(self, bead_id: str):
+        """
+        Move tasks whose last unmet dependency was bead_id onto the ready set.
+
+        Args:
+            bead_id: ID of the bead that was just closed
+        """
+        pending = self._pending_deps
+        for dependent in sorted(self._dependents.pop(bead_id, ())):
+            pending[dependent] -= 1
+            if not pending[dependent] and self._ready is not None:
+                if dependent in self._needs_bd_check:
+                    self._unverified.append(dependent)
+                else:
+                    self._ready.append(dependent)
+
+    def _verify_released(self, force: bool = False):
+        """
+        Move released tasks that `bd ready` confirms onto the ready set.
+
+        Runs one ``bd ready`` for all waiting tasks, after flushing the
+        closes that released them. Tasks bd still holds back (e.g. for an
+        open blocker in another epic) keep waiting and are checked again
+        only once the bd store has changed.
+
+        Args:
+            force: Query bd even if the store is unchanged since the last check
+        """
+        key = self._store_key()
+        if not force and key is not None and key == self._verified_key:
+            return
+
+        self.flush_writes()
+        self._verified_key = self._store_key()
+        ready = set(self.get_ready_tasks())
+        confirmed = [task_id for task_id in self._unverified if task_id in ready]
+        self._unverified = [task_id for task_id in self._unverified if task_id not in ready]
+        self._ready.extend(confirmed)
+
     def get_ready_tasks(self) -> List[str]:
         """
         Get tasks ready to execute (open + no blockers).
@@ -96,14 +377,10 @@ class BeadOrchestrator:
         Returns:
             List of bead IDs that are ready to start
         """
-        result = subprocess.run(
-            ["bd", "ready", "--json"],
-            capture_output=True,
-            text=True
-        )
-        ready = json.loads(result.stdout)
+        ready = self._bd_json("ready")
         # Filter to only children of our epic
-        return [b["id"] for b in ready if b["id"].startswith(self.epic_id)]
+        prefix = self._child_prefix
+        return [b["id"] for b in ready if b["id"].startswith(prefix)]
 
     def start_worker(self, bead_id: str):
         """
@@ -115,53 +392,84 @@ class BeadOrchestrator:
         Side effects:
             - Marks bead as in_progress
             - Creates and starts Worker subprocess
-            - Tracks worker in active_workers
-            - Records start time for duration calculation
+            - Tracks worker and its start time in active
+
+        The in_progress update runs in the background and may not have
+        landed when this returns. Callers outside start() that read the
+        bead back from bd must call flush_writes() first.
         """
-        # Mark bead as in_progress
-        subprocess.run(["bd", "update", bead_id, "--status=in_progress"])
+        self.start_workers([bead_id])
 
-        # Get task description
-        result = subprocess.run(
-            ["bd", "show", bead_id, "--json"],
-            capture_output=True,
-            text=True
-        )
-        bead = json.loads(result.stdout)[0]
-        description = bead.get("description") or bead["title"]
-
-        # Record start time
-        self.task_start_times[bead_id] = time.time()
-
-        # Spawn worker (same as cascade mode)
-        worker = Worker(task_id=bead_id, task_description=description)
-        command = [
-            "claude",
-            "--model", "sonnet",
-            "--dangerously-skip-permissions",
-            "--print",
-            "--output-format", "json",
-            description,
-        ]
-        worker.start(command)
-        self.active_workers[bead_id] = worker
-
-    def complete_task(self, bead_id: str, worker: Worker):
+    def start_workers(self, bead_ids: List[str]):
+        """
+        Start workers for several bead tasks with one bd call per step.
+
+        All beads are marked in_progress by a single ``bd update``, and any
+        descriptions missing from the loaded graph are fetched by a single
+        ``bd show``, instead of one of each per bead.
+
+        As with start_worker(), the in_progress update runs in the
+        background; call flush_writes() before reading the beads back.
+
+        Args:
+            bead_ids: IDs of the beads to execute
+        """
+        if not bead_ids:
+            return
+
+        # Mark beads as in_progress
+        self._spawn_write(bead_ids, ["bd", "update", *bead_ids, "--status=in_progress"])
+
+        # Get task descriptions, falling back to bd show for beads the graph
+        # hasn't been loaded for (or that were added after it was)
+        descriptions = {
+            bead_id: task["description"]
+            for bead_id in bead_ids
+            if (task := self.tasks.get(bead_id)) is not None
+        }
+        missing = [bead_id for bead_id in bead_ids if bead_id not in descriptions]
+        if missing:
+            for bead in self._bd_json("show", *missing):
+                descriptions[bead["id"]] = bead.get("description") or bead["title"]
+
+        for bead_id in bead_ids:
+            description = descriptions[bead_id]
+            start_time = time.time()
+
+            # Spawn worker (same as cascade mode)
+            worker = Worker(task_id=bead_id, task_description=description)
+            command = [
+                "claude",
+                "--model", "sonnet",
+                "--dangerously-skip-permissions",
+                "--print",
+                "--output-format", "json",
+                description,
+            ]
+            worker.start(command)
+            worker.notify_on_exit(self._wakeup)
+            self.active[bead_id] = _ActiveWorker(worker, start_time)
+
+    def complete_task(self, bead_id: str, worker: Worker, start_time: Optional[float] = None):
         """
         Mark bead complete and store metrics.
 
         Args:
             bead_id: ID of the bead that completed
             worker: Worker instance that executed the task
+            start_time: time.time() when the task started (duration is 0 if unknown)
 
         Side effects:
             - Adds structured JSON metrics comment to bead
             - Closes the bead
+
+        The comment and close run in the background and may not have landed
+        when this returns. Callers outside start() that read the bead back
+        from bd must call flush_writes() first.
         """
         token_usage = worker.get_token_usage()
 
         # Calculate duration
-        start_time = self.task_start_times.get(bead_id)
         if start_time:
             duration = time.time() - start_time
         else:
@@ -176,41 +484,45 @@ class BeadOrchestrator:
             "cost_usd": cost,
             "duration_seconds": int(duration)
         }
-        metrics_json = json.dumps(metrics)
-
-        # Add metrics comment to the bead
-        subprocess.run([
-            "bd", "comments", "add", bead_id, metrics_json
-        ])
+        metrics_json = json_codec.dumps(metrics)
 
-        # Close the bead
-        subprocess.run(["bd", "close", bead_id])
+        # Add metrics comment to the bead, then close it
+        self._bd_write_sequence(
+            bead_id,
+            ["comments", "add", bead_id, metrics_json],
+            ["close", bead_id],
+        )
 
-        # Clean up start time tracking
-        self.task_start_times.pop(bead_id, None)
+        # Dependents may now be ready
+        self._release_dependents(bead_id)
 
     def stop(self):
         """
         Signal the orchestrator to stop gracefully.
 
-        Sets the stop_flag to signal the main loop to exit.
+        Sets the stop_flag to signal the main loop to exit, waking it
+        immediately if it is waiting between checks.
         Workers will be allowed to complete their current tasks.
         """
         self.stop_flag.set()
+        self._wakeup.set()
 
     def start(self, check_interval: float = 2.0, max_iterations: Optional[int] = None):
         """
         Start the orchestrator main loop.
 
         This method will:
-        1. Get ready tasks
+        1. Get ready tasks (queried from bd once, then tracked locally)
         2. Start workers (up to max_workers limit)
         3. Monitor workers for completion
         4. Complete tasks when workers finish
         5. Repeat until no more tasks are ready or stop_flag is set
 
+        Between iterations the loop blocks until a worker exits, stop() is
+        called, or check_interval elapses, whichever comes first.
+
         Args:
-            check_interval: Time in seconds between status checks (default: 2.0)
+            check_interval: Maximum time in seconds between status checks (default: 2.0)
             max_iterations: Maximum number of iterations (None = unlimited)
 
         Side effects:
@@ -227,31 +539,52 @@ class BeadOrchestrator:
 
             iteration += 1
 
-            # Get ready tasks
-            ready_tasks = self.get_ready_tasks()
+            # Anything that exits from here on wakes the wait below
+            self._wakeup.clear()
+
+            # Forget bd writes that have finished
+            self._reap_writes()
+
+            # Query bd once; afterwards the ready set is maintained locally
+            if self._ready is None:
+                self._seed_ready_tasks()
+            if self._unverified:
+                self._verify_released()
+            ready_tasks = self._ready
 
             # Start workers for ready tasks (respecting max_workers limit)
-            available_slots = self.max_workers - len(self.active_workers)
-            for task_id in ready_tasks[:available_slots]:
-                if task_id not in self.active_workers:
-                    self.start_worker(task_id)
+            available_slots = self.max_workers - len(self.active)
+            self.start_workers([
+                task_id for task_id in ready_tasks[:available_slots]
+                if task_id not in self.active
+            ])
+            del ready_tasks[:max(available_slots, 0)]
 
             # Check status of active workers
             completed_workers = []
-            for task_id, worker in list(self.active_workers.items()):
-                if not worker.is_alive():
-                    exit_code = worker.wait()
+            for task_id, active in list(self.active.items()):
+                if not active.worker.is_alive():
+                    exit_code = active.worker.wait()
                     if exit_code == 0:
-                        self.complete_task(task_id, worker)
+                        self.complete_task(task_id, active.worker, active.start_time)
                     completed_workers.append(task_id)
 
             # Remove completed workers from active list
             for task_id in completed_workers:
-                self.active_workers.pop(task_id, None)
+                self.active.pop(task_id, None)
 
             # Exit if no more work to do
-            if not self.active_workers and not ready_tasks:
+            if not self.active and not ready_tasks:
+                # The last completions may have released tasks that only bd
+                # can confirm; check them before giving up
+                if self._unverified:
+                    self._verify_released(force=True)
+                    if ready_tasks:
+                        continue
                 break
 
-            # Wait before next iteration
-            time.sleep(check_interval)
+            # Wait for a worker to exit (or stop()) before next iteration
+            self._wakeup.wait(check_interval)
+
+        # Make sure bead updates have landed before returning
+        self.flush_writes()
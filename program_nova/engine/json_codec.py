@@ -0,0 +1,40 @@
+"""JSON encode/decode helpers for the execution engine.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise, so orjson stays an optional speedup.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def loads(data: Union[str, bytes, memoryview]) -> Any:
+    """Decode a JSON document from str, bytes or a buffer such as an mmap view."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode obj as a compact JSON string."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, optionally indented by two spaces."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
@@ -11,16 +11,39 @@ Main responsibilities:
 7. Advance execution by starting new tasks as dependencies complete
 """
 
+import logging
+import logging.handlers
+import queue
+import threading
 import time
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from program_nova.engine.parser import parse_cascade, DAG
+from program_nova.engine.parser import parse_cascade_cached, DAG
 from program_nova.engine.state import StateManager, TaskStatus
 from program_nova.engine.worker import Worker, WorkerStatus
 
 
+# Command prefix for spawning a Claude Code agent; the task description is
+# appended as the final argument
+CLAUDE_WORKER_COMMAND = (
+    "claude",
+    "--model",
+    "sonnet",
+    # Add permission bypass flag so workers don't prompt for file creation
+    "--dangerously-skip-permissions",
+    "--print",  # Non-interactive mode (required for JSON output)
+    "--output-format",
+    "json",  # JSON output includes token usage and cost
+)
+
+# Shortest wait between loop iterations; the wait backs off from here
+# towards check_interval while nothing changes
+MIN_POLL_INTERVAL = 0.05
+
+
 class Orchestrator:
     """
     Main orchestrator that manages cascade execution.
@@ -49,14 +72,15 @@ class Orchestrator:
         self.state_file = state_file
         self.max_workers = max_workers
 
-        # Parse the cascade file
-        self.cascade_data = parse_cascade(cascade_file)
+        # Parse the cascade file (reusing the cached parse if unchanged)
+        self.cascade_data = parse_cascade_cached(cascade_file)
         self.tasks = self.cascade_data["tasks"]
         self.hierarchy = self.cascade_data["hierarchy"]
         self.dag = self.cascade_data["dag"]
 
-        # Initialize state manager
-        self.state_mgr = StateManager(state_file)
+        # Initialize state manager; frequent per-task updates go to the
+        # write-ahead log and are folded into the state file as it grows
+        self.state_mgr = StateManager(state_file, wal=True)
 
         # Initialize state file if it doesn't exist
         if not Path(state_file).exists():
@@ -72,7 +96,18 @@ class Orchestrator:
         # Track active workers
         self.active_workers: Dict[str, Worker] = {}
 
-    def get_ready_tasks(self) -> List[str]:
+        # Epoch start time of each worker started by this orchestrator, so
+        # completion doesn't have to read and parse started_at from state
+        self._start_times: Dict[str, float] = {}
+
+        # Token usage last written to state for each active worker
+        self._last_token_usage: Dict[str, Dict[str, int]] = {}
+
+        # Set by each worker as it exits or reports new token usage so
+        # run() can react immediately
+        self._wakeup = threading.Event()
+
+    def get_ready_tasks(self, state: Optional[Dict] = None) -> List[str]:
         """
         Get list of tasks that are ready to execute.
 
@@ -80,31 +115,32 @@ class Orchestrator:
         - Status is pending (not started/completed/failed/in-progress)
         - All dependencies have status 'completed'
 
+        Args:
+            state: State already read this tick (read from the file if omitted)
+
         Returns:
             List of task IDs that are ready to start
         """
-        state = self.state_mgr.read_state()
+        if state is None:
+            state = self.state_mgr.read_state()
         task_states = state.get("tasks", {})
 
-        # Build a dict of task_id -> status for completed/in_progress/failed tasks
+        # Build task_id -> status and the completed set in one pass
         task_status_map = {}
+        completed = set()
         for task_id, task_data in task_states.items():
             status = task_data.get("status", "pending")
             task_status_map[task_id] = status
+            if status == "completed":
+                completed.add(task_id)
 
-        # Get ready tasks from DAG
-        # We need to pass tasks that have been started/completed
-        completed_or_started = {
-            tid: status
-            for tid, status in task_status_map.items()
-            if status in ["completed", "in_progress", "failed"]
-        }
-
-        ready = self.dag.get_ready_tasks(completed_or_started)
+        # Apply completions (including ones written by other processes) to
+        # the DAG's incremental ready set
+        self.dag.sync_completed(completed)
 
         # Filter out tasks that are already in progress or being tracked
         ready = [
-            tid for tid in ready
+            tid for tid in self.dag.ready_tasks()
             if task_status_map.get(tid, "pending") == "pending"
             and tid not in self.active_workers
         ]
@@ -131,21 +167,11 @@ class Orchestrator:
         worker = Worker(task_id=task_id, task_description=task_description)
 
         # Build command for worker to spawn Claude Code agent
-        # Add permission bypass flag so workers don't prompt for file creation
-        # Use JSON output format to capture token usage and other metrics
-        command = [
-            "claude",
-            "--model",
-            "sonnet",
-            "--dangerously-skip-permissions",
-            "--print",  # Non-interactive mode (required for JSON output)
-            "--output-format",
-            "json",  # JSON output includes token usage and cost
-            task_description,
-        ]
+        command = [*CLAUDE_WORKER_COMMAND, task_description]
 
         # Mark task as in-progress in state
-        started_at = datetime.now(timezone.utc).isoformat()
+        start_time = time.time()
+        started_at = datetime.fromtimestamp(start_time, timezone.utc).isoformat()
         self.state_mgr.update_task(
             task_id,
             status=TaskStatus.IN_PROGRESS,
@@ -156,12 +182,15 @@ class Orchestrator:
         # Start the worker in the current working directory
         # This ensures workers run in the project directory where nova was invoked
         worker.start(command, cwd=str(Path.cwd()))
+        worker.notify_on_exit(self._wakeup)
+        worker.notify_on_progress(self._wakeup)
 
         # Update state with PID
         self.state_mgr.update_task(task_id, pid=worker.pid)
 
         # Track the worker
         self.active_workers[task_id] = worker
+        self._start_times[task_id] = start_time
 
     def monitor_workers(self) -> None:
         """
@@ -179,15 +208,17 @@ class Orchestrator:
         completed_workers = []
 
         for task_id, worker in self.active_workers.items():
-            # Update token usage
+            # Update token usage (only when it changed since the last write)
             token_usage = worker.get_token_usage()
-            self.state_mgr.update_task_tokens(
-                task_id,
-                input_tokens=token_usage["input_tokens"],
-                output_tokens=token_usage["output_tokens"],
-                cache_read_tokens=token_usage["cache_read_tokens"],
-                cache_creation_tokens=token_usage["cache_creation_tokens"],
-            )
+            if token_usage != self._last_token_usage.get(task_id):
+                self.state_mgr.update_task_tokens(
+                    task_id,
+                    input_tokens=token_usage["input_tokens"],
+                    output_tokens=token_usage["output_tokens"],
+                    cache_read_tokens=token_usage["cache_read_tokens"],
+                    cache_creation_tokens=token_usage["cache_creation_tokens"],
+                )
+                self._last_token_usage[task_id] = token_usage
 
             # Check if worker has finished
             if not worker.is_alive():
@@ -205,27 +236,26 @@ class Orchestrator:
         # Remove completed workers from tracking
         for task_id in completed_workers:
             del self.active_workers[task_id]
+            self._last_token_usage.pop(task_id, None)
 
     def _handle_task_completion(self, task_id: str, worker: Worker) -> None:
         """
         Handle successful task completion.
 
+        Duration comes from the start time recorded by start_worker(), so
+        no state is read here.
+
         Args:
             task_id: ID of the completed task
             worker: Worker instance that completed the task
         """
-        # Get task start time to calculate duration
-        state = self.state_mgr.read_state()
-        task_data = state["tasks"].get(task_id, {})
-        started_at_str = task_data.get("started_at")
+        completed_time = time.time()
+        completed_at = datetime.fromtimestamp(completed_time, timezone.utc)
 
-        if started_at_str:
-            started_at = datetime.fromisoformat(started_at_str)
-            completed_at = datetime.now(timezone.utc)
-            duration_seconds = int((completed_at - started_at).total_seconds())
-        else:
-            duration_seconds = 0
-            completed_at = datetime.now(timezone.utc)
+        # Every worker in active_workers is started by start_worker(); a
+        # missing start time means the worker was tracked some other way
+        start_time = self._start_times.pop(task_id, completed_time)
+        duration_seconds = int(completed_time - start_time)
 
         # Mark as completed in state
         self.state_mgr.complete_task(
@@ -234,6 +264,9 @@ class Orchestrator:
             duration_seconds=duration_seconds,
         )
 
+        # Release dependents in the DAG's ready set
+        self.dag.mark_completed(task_id)
+
     def _handle_task_failure(
         self, task_id: str, worker: Worker, exit_code: int
     ) -> None:
@@ -245,6 +278,7 @@ class Orchestrator:
             worker: Worker instance that failed
             exit_code: Non-zero exit code from the worker process
         """
+        self._start_times.pop(task_id, None)
         error_msg = f"Worker exited with code {exit_code}"
         self.state_mgr.fail_task(task_id, error=error_msg)
 
@@ -259,8 +293,14 @@ class Orchestrator:
         4. Handles completions/failures
         5. Repeats until all tasks are complete or blocked
 
+        Between iterations the loop blocks until a worker exits, a worker
+        reports new token usage, or the poll interval elapses, whichever
+        comes first. The interval starts at MIN_POLL_INTERVAL, grows by half
+        on each idle iteration up to check_interval, and resets whenever a
+        worker starts or finishes.
+
         Args:
-            check_interval: Seconds to wait between loop iterations (default: 2.0)
+            check_interval: Maximum seconds to wait between loop iterations (default: 2.0)
             max_iterations: Maximum loop iterations (for testing, default: None = unlimited)
 
         Side effects:
@@ -271,6 +311,7 @@ class Orchestrator:
         # Mark project as started
         self.state_mgr.update_project(started_at=datetime.now(timezone.utc).isoformat())
 
+        poll_interval = min(MIN_POLL_INTERVAL, check_interval)
         iteration = 0
         while True:
             iteration += 1
@@ -279,25 +320,41 @@ class Orchestrator:
             if max_iterations is not None and iteration > max_iterations:
                 break
 
-            # Monitor existing workers
-            self.monitor_workers()
+            # Any worker exiting or reporting usage from here on wakes the
+            # wait below
+            self._wakeup.clear()
 
-            # Check if we can start new workers
-            available_slots = self.max_workers - len(self.active_workers)
-
-            if available_slots > 0:
-                ready_tasks = self.get_ready_tasks()
+            # Monitor existing workers, writing all their updates at once
+            workers_before = len(self.active_workers)
+            with self.state_mgr.batch():
+                self.monitor_workers()
+            changed = len(self.active_workers) != workers_before
 
-                # Start workers for ready tasks (up to available slots)
-                for task_id in ready_tasks[:available_slots]:
-                    self.start_worker(task_id)
+            # Read state once for this tick
+            state = self.state_mgr.read_state()
+            ready_tasks = self.get_ready_tasks(state)
 
-            # Check if execution is complete
-            if self._is_execution_complete():
+            # Start workers for ready tasks (up to available slots)
+            available_slots = max(self.max_workers - len(self.active_workers), 0)
+            if available_slots > 0:
+                with self.state_mgr.batch():
+                    for task_id in ready_tasks[:available_slots]:
+                        self.start_worker(task_id)
+                        changed = True
+
+            # Check if execution is complete, using the ready tasks still
+            # waiting for a slot rather than recomputing them
+            if self._is_execution_complete(ready_tasks[available_slots:]):
                 break
 
-            # Wait before next iteration
-            time.sleep(check_interval)
+            # Poll quickly while things are moving, back off while idle
+            if changed:
+                poll_interval = min(MIN_POLL_INTERVAL, check_interval)
+            else:
+                poll_interval = min(check_interval, poll_interval * 1.5)
+
+            # Wait for a worker to exit or report usage before next iteration
+            self._wakeup.wait(poll_interval)
 
         # Final monitoring pass to ensure all workers are handled
         self.monitor_workers()
@@ -305,7 +362,10 @@ class Orchestrator:
         # Mark project as completed
         self.state_mgr.update_project(completed_at=datetime.now(timezone.utc).isoformat())
 
-    def _is_execution_complete(self) -> bool:
+        # Leave a self-contained state file behind
+        self.state_mgr.compact()
+
+    def _is_execution_complete(self, ready_tasks: Optional[List[str]] = None) -> bool:
         """
         Check if execution is complete.
 
@@ -315,6 +375,10 @@ class Orchestrator:
 
         This means all tasks are either completed, failed, or blocked by failed dependencies.
 
+        Args:
+            ready_tasks: Ready tasks from this tick not yet dispatched
+                (recomputed from state if omitted)
+
         Returns:
             True if execution is complete, False otherwise
         """
@@ -323,7 +387,8 @@ class Orchestrator:
             return False
 
         # If there are ready tasks, not done
-        ready_tasks = self.get_ready_tasks()
+        if ready_tasks is None:
+            ready_tasks = self.get_ready_tasks()
         if ready_tasks:
             return False
 
@@ -346,26 +411,24 @@ class Orchestrator:
         state = self.state_mgr.read_state()
         task_states = state.get("tasks", {})
 
+        # One hash-table increment per task instead of a chain of string compares
+        counts = Counter(
+            task_data.get("status", "pending") for task_data in task_states.values()
+        )
+        completed = counts[TaskStatus.COMPLETED.value]
+        failed = counts[TaskStatus.FAILED.value]
+        in_progress = counts[TaskStatus.IN_PROGRESS.value]
+
         summary = {
             "total_tasks": len(self.tasks),
-            "completed": 0,
-            "failed": 0,
-            "in_progress": 0,
-            "pending": 0,
+            "completed": completed,
+            "failed": failed,
+            "in_progress": in_progress,
+            # Anything else (including unknown statuses) counts as pending
+            "pending": len(task_states) - completed - failed - in_progress,
             "active_workers": len(self.active_workers),
         }
 
-        for task_data in task_states.values():
-            status = task_data.get("status", "pending")
-            if status == "completed":
-                summary["completed"] += 1
-            elif status == "failed":
-                summary["failed"] += 1
-            elif status == "in_progress":
-                summary["in_progress"] += 1
-            else:
-                summary["pending"] += 1
-
         # Account for tasks not yet in state (they're pending)
         tasks_in_state = len(task_states)
         if tasks_in_state < summary["total_tasks"]:
@@ -374,21 +437,23 @@ class Orchestrator:
         return summary
 
 
+# Background thread writing daemon-mode log records to the log file
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging(daemon_mode: bool = False):
     """
     Setup logging configuration.
 
+    In daemon mode, records are handed to a queue and written to the
+    rotating log file by a background QueueListener, so the run loop
+    never blocks on file writes.
+
     Args:
         daemon_mode: If True, configure logging for daemon mode (log to file)
                     If False, log to console
     """
-    import logging
-    import logging.handlers
-    from pathlib import Path
-
-    # Create logs directory if it doesn't exist (relative to cwd)
-    logs_dir = Path.cwd() / "logs"
-    logs_dir.mkdir(exist_ok=True)
+    global _log_listener
 
     # Configure root logger
     logger = logging.getLogger()
@@ -396,9 +461,13 @@ def setup_logging(daemon_mode: bool = False):
 
     # Clear any existing handlers
     logger.handlers.clear()
+    stop_logging()
 
     if daemon_mode:
-        # Daemon mode: log to file with rotation
+        # Daemon mode: log to file with rotation. Only this mode writes
+        # under logs/, so the directory (relative to cwd) is created here.
+        logs_dir = Path.cwd() / "logs"
+        logs_dir.mkdir(exist_ok=True)
         log_file = logs_dir / "orchestrator.log"
         handler = logging.handlers.RotatingFileHandler(
             log_file,
@@ -408,6 +477,13 @@ def setup_logging(daemon_mode: bool = False):
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
+        handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, handler)
+        _log_listener.start()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        return logger
     else:
         # Interactive mode: log to console
         handler = logging.StreamHandler()
@@ -421,6 +497,17 @@ def setup_logging(daemon_mode: bool = False):
     return logger
 
 
+def stop_logging():
+    """Flush and stop the daemon-mode log writer thread, if running."""
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
 def main():
     """
     Main entry point for running the orchestrator.
@@ -480,9 +567,11 @@ def main():
         )
     except FileNotFoundError as e:
         logger.error(f"File not found: {e}")
+        stop_logging()
         sys.exit(1)
     except Exception as e:
         logger.error(f"Failed to initialize orchestrator: {e}")
+        stop_logging()
         sys.exit(1)
 
     logger.info(f"Starting Program Nova orchestrator")
@@ -513,6 +602,8 @@ def main():
     except Exception as e:
         logger.error(f"Orchestrator error: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -6,9 +6,13 @@ Parses a hierarchical task breakdown file (CASCADE.md) into:
 - DAG for dependency resolution
 """
 
+import hashlib
+import io
+import json
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 from collections import defaultdict, deque
 
 
@@ -25,40 +29,88 @@ class DAG:
             ValueError: If a cycle is detected in dependencies
         """
         self.tasks = tasks
+
+        # Deduplicated dependencies per task, read once from the task dicts
+        # so traversals don't repeat .get('depends_on', []) lookups
+        self._deps: Dict[str, Tuple[str, ...]] = {
+            task_id: tuple(dict.fromkeys(task_info.get('depends_on', ())))
+            for task_id, task_info in tasks.items()
+        }
         self._validate_no_cycles()
 
+        # Reverse index: dependency -> tasks that depend on it
+        self.dependents: Dict[str, List[str]] = defaultdict(list)
+        for task_id, deps in self._deps.items():
+            for dep in deps:
+                self.dependents[dep].append(task_id)
+
+        # Task order, so incremental ready lists match get_ready_tasks()
+        self._order = {task_id: index for index, task_id in enumerate(tasks)}
+        self.reset_progress()
+
+        # Depth of every task, computed once
+        self.depth: Dict[str, int] = self._compute_depths()
+
     def _validate_no_cycles(self):
-        """Check for cycles in the dependency graph using DFS.
+        """Check for cycles in the dependency graph using iterative DFS.
+
+        An explicit stack of (task_id, dependency iterator) pairs replaces
+        recursion, so arbitrarily deep dependency chains are safe.
 
         Raises:
             ValueError: If a cycle is detected
         """
+        all_deps = self._deps
         visited = set()
         rec_stack = set()
 
-        def has_cycle(task_id: str) -> bool:
-            """DFS to detect cycles."""
-            if task_id in rec_stack:
-                return True
-            if task_id in visited:
-                return False
+        for root in self.tasks:
+            if root in visited:
+                continue
 
-            visited.add(task_id)
-            rec_stack.add(task_id)
+            visited.add(root)
+            rec_stack.add(root)
+            stack = [(root, iter(all_deps[root]))]
+
+            while stack:
+                task_id, deps = stack[-1]
+                for dep in deps:
+                    if dep not in self.tasks:
+                        continue
+                    if dep in rec_stack:
+                        raise ValueError(f"Cyclic dependency detected involving task {root}")
+                    if dep not in visited:
+                        visited.add(dep)
+                        rec_stack.add(dep)
+                        stack.append((dep, iter(all_deps[dep])))
+                        break
+                else:
+                    # All dependencies explored
+                    stack.pop()
+                    rec_stack.discard(task_id)
+
+    def _compute_depths(self) -> Dict[str, int]:
+        """Compute every task's depth with one Kahn-order topological pass.
 
-            for dep in self.tasks.get(task_id, {}).get('depends_on', []):
-                if dep not in self.tasks:
-                    continue
-                if has_cycle(dep):
-                    return True
+        Returns:
+            Dict mapping task_id -> depth
+        """
+        remaining = {
+            task_id: sum(1 for dep in deps if dep in self.tasks)
+            for task_id, deps in self._deps.items()
+        }
+        depth = {task_id: 0 for task_id, count in remaining.items() if count == 0}
+        queue = deque(depth)
 
-            rec_stack.remove(task_id)
-            return False
+        while queue:
+            task_id = queue.popleft()
+            for dependent in self.dependents.get(task_id, ()):
+                depth[dependent] = max(depth.get(dependent, 0), depth[task_id] + 1)
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    queue.append(dependent)
 
-        for task_id in self.tasks:
-            if task_id not in visited:
-                if has_cycle(task_id):
-                    raise ValueError(f"Cyclic dependency detected involving task {task_id}")
+        return depth
 
     def get_ready_tasks(self, completed_tasks: Dict[str, str]) -> List[str]:
         """Get list of tasks that are ready to execute.
@@ -75,13 +127,12 @@ class DAG:
         """
         ready = []
 
-        for task_id, task_info in self.tasks.items():
+        for task_id, dependencies in self._deps.items():
             # Skip if already completed
             if task_id in completed_tasks:
                 continue
 
             # Check if all dependencies are satisfied
-            dependencies = task_info.get('depends_on', [])
             all_deps_complete = all(
                 dep in completed_tasks and completed_tasks[dep] == 'completed'
                 for dep in dependencies
@@ -92,59 +143,113 @@ class DAG:
 
         return ready
 
-    def get_task_depth(self, task_id: str, memo: Optional[Dict[str, int]] = None) -> int:
-        """Calculate the depth of a task in the dependency tree.
+    def reset_progress(self):
+        """Forget all completions recorded with mark_completed()."""
+        self._completed: Set[str] = set()
+        self._remaining: Dict[str, int] = {
+            task_id: len(deps) for task_id, deps in self._deps.items()
+        }
+        self._ready: Set[str] = {
+            task_id for task_id, count in self._remaining.items() if count == 0
+        }
+
+    def mark_completed(self, task_id: str) -> List[str]:
+        """Record a task as completed and update the incremental ready set.
 
-        Tasks with no dependencies have depth 0.
-        Other tasks have depth = 1 + max(depth of dependencies).
+        Only the task's dependents are touched, so keeping the ready set
+        current costs O(dependents) per completion rather than a full scan.
 
         Args:
-            task_id: ID of the task
-            memo: Memoization dictionary for computed depths
+            task_id: ID of the completed task
 
         Returns:
-            Depth of the task
+            Task IDs that became ready as a result
         """
-        if memo is None:
-            memo = {}
+        if task_id in self._completed:
+            return []
 
-        if task_id in memo:
-            return memo[task_id]
+        self._completed.add(task_id)
+        self._ready.discard(task_id)
 
-        task_info = self.tasks.get(task_id, {})
-        dependencies = task_info.get('depends_on', [])
+        newly_ready = []
+        for dependent in self.dependents.get(task_id, ()):
+            self._remaining[dependent] -= 1
+            if self._remaining[dependent] == 0 and dependent not in self._completed:
+                self._ready.add(dependent)
+                newly_ready.append(dependent)
+        return newly_ready
 
-        if not dependencies:
-            depth = 0
-        else:
-            depth = 1 + max(
-                self.get_task_depth(dep, memo)
-                for dep in dependencies
-                if dep in self.tasks
-            )
+    def sync_completed(self, completed: Set[str]):
+        """Bring the incremental ready set in line with a set of completed tasks.
 
-        memo[task_id] = depth
-        return depth
+        Newly completed tasks are applied with mark_completed(). If a task
+        previously recorded as completed is missing (e.g. it was reset),
+        progress is rebuilt from scratch.
+
+        Args:
+            completed: IDs of every task currently completed
+        """
+        if not self._completed <= completed:
+            self.reset_progress()
+        for task_id in completed - self._completed:
+            self.mark_completed(task_id)
+
+    def ready_tasks(self) -> List[str]:
+        """Get tasks whose dependencies are all recorded as completed.
+
+        Unlike get_ready_tasks(), this uses the incremental state kept by
+        mark_completed()/sync_completed() instead of scanning every task.
+
+        Returns:
+            List of task IDs that are ready, in task order
+        """
+        return sorted(self._ready, key=self._order.__getitem__)
+
+    def get_task_depth(self, task_id: str) -> int:
+        """Get the depth of a task in the dependency tree.
+
+        Tasks with no dependencies have depth 0.
+        Other tasks have depth = 1 + max(depth of dependencies).
+        Depths are precomputed in __init__, so this is a dict lookup.
+
+        Args:
+            task_id: ID of the task
+
+        Returns:
+            Depth of the task
+        """
+        return self.depth.get(task_id, 0)
 
 
 class CascadeParser:
     """Parser for CASCADE.md files."""
 
-    # Regex patterns for parsing
-    L0_PATTERN = re.compile(r'^#\s+(.+)$')  # Project name
-    L1_PATTERN = re.compile(r'^##\s+L1:\s+(.+)$')  # L1 branches
-    L2_PATTERN = re.compile(r'^###\s+L2:\s+(.+)$')  # L2 groups
-    TABLE_HEADER = re.compile(r'^\|\s*Task ID\s*\|')
-    TABLE_ROW = re.compile(r'^\|\s*(\S+)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|')
+    # Single pattern classifying heading lines; the named group that
+    # matched (m.lastgroup) says which kind of heading it is. Table lines
+    # are split on '|' instead of going through a regex.
+    HEADING_PATTERN = re.compile(
+        r'(?P<l0>#\s+(?P<l0v>.+))'  # Project name
+        r'|(?P<l1>##\s+L1:\s+(?P<l1v>.+))'  # L1 branches
+        r'|(?P<l2>###\s+L2:\s+(?P<l2v>.+))'  # L2 groups
+    )
 
-    def __init__(self, cascade_file: str):
-        """Initialize parser with CASCADE.md file path.
+    def __init__(self, cascade_file: Optional[str] = None, *, text: Optional[str] = None):
+        """Initialize parser with a CASCADE.md file path or its contents.
 
         Args:
             cascade_file: Path to CASCADE.md file
+            text: CASCADE.md contents, parsed without touching the filesystem
+
+        Raises:
+            ValueError: If not exactly one of cascade_file and text is given
+            FileNotFoundError: If cascade_file does not exist
         """
-        self.cascade_file = Path(cascade_file)
-        if not self.cascade_file.exists():
+        if (cascade_file is None) == (text is None):
+            raise ValueError("Pass exactly one of cascade_file or text")
+
+        self.text = text
+        self.cascade_file = Path(cascade_file) if cascade_file is not None else None
+        if self.cascade_file is not None and not self.cascade_file.exists():
             raise FileNotFoundError(f"CASCADE file not found: {cascade_file}")
 
     def parse(self) -> Dict:
@@ -157,9 +262,6 @@ class CascadeParser:
             - hierarchy: Dict[L1, Dict[L2, List[task_id]]]
             - dag: DAG instance for dependency resolution
         """
-        with open(self.cascade_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
         project_name = None
         current_l1 = None
         current_l2 = None
@@ -167,47 +269,37 @@ class CascadeParser:
         hierarchy = defaultdict(lambda: defaultdict(list))
         in_table = False
 
-        for line in lines:
-            line = line.rstrip()
-
-            # Parse project name (L0)
-            l0_match = self.L0_PATTERN.match(line)
-            if l0_match and project_name is None:
-                project_name = l0_match.group(1).strip()
-                continue
-
-            # Parse L1 branch
-            l1_match = self.L1_PATTERN.match(line)
-            if l1_match:
-                current_l1 = l1_match.group(1).strip()
-                current_l2 = None
-                in_table = False
-                continue
-
-            # Parse L2 group
-            l2_match = self.L2_PATTERN.match(line)
-            if l2_match:
-                current_l2 = l2_match.group(1).strip()
-                in_table = False
-                continue
-
-            # Detect table header
-            if self.TABLE_HEADER.match(line):
-                in_table = True
-                continue
-
-            # Skip table separator line
-            if in_table and line.startswith('|---'):
-                continue
-
-            # Parse table row
-            if in_table and current_l1 and current_l2:
-                row_match = self.TABLE_ROW.match(line)
-                if row_match:
-                    task_id = row_match.group(1).strip()
-                    task_name = row_match.group(2).strip()
-                    description = row_match.group(3).strip()
-                    depends_on_raw = row_match.group(4).strip()
+        # Iterate the file lazily rather than loading every line up front
+        if self.text is not None:
+            source = io.StringIO(self.text)
+        else:
+            source = open(self.cascade_file, 'r', encoding='utf-8')
+        with source as f:
+            for raw in f:
+                line = raw.rstrip()
+
+                if line.startswith('|'):
+                    # Table line: "| id | name | description | depends on |"
+                    cells = line.split('|')
+
+                    # Detect table header
+                    if len(cells) > 2 and cells[1].strip() == 'Task ID':
+                        in_table = True
+                        continue
+
+                    # Skip separator lines and anything outside a table
+                    if line.startswith('|---') or not (in_table and current_l1 and current_l2):
+                        continue
+
+                    # Parse table row: four non-empty cells, closed by '|'
+                    if len(cells) < 6 or not all(cells[1:5]):
+                        continue
+                    task_id = cells[1].strip()
+                    if not task_id or len(task_id.split()) != 1:
+                        continue
+                    task_name = cells[2].strip()
+                    description = cells[3].strip()
+                    depends_on_raw = cells[4].strip()
 
                     # Parse dependencies
                     depends_on = self._parse_dependencies(depends_on_raw)
@@ -224,6 +316,30 @@ class CascadeParser:
 
                     # Update hierarchy
                     hierarchy[current_l1][current_l2].append(task_id)
+                    continue
+
+                m = self.HEADING_PATTERN.match(line)
+                if m is None:
+                    continue
+                kind = m.lastgroup
+
+                # Parse project name (L0)
+                if kind == 'l0':
+                    if project_name is None:
+                        project_name = m.group('l0v').strip()
+                    continue
+
+                # Parse L1 branch
+                if kind == 'l1':
+                    current_l1 = m.group('l1v').strip()
+                    current_l2 = None
+                    in_table = False
+                    continue
+
+                # Parse L2 group
+                if kind == 'l2':
+                    current_l2 = m.group('l2v').strip()
+                    in_table = False
 
         # Convert defaultdict to regular dict for cleaner output
         hierarchy = {
@@ -275,3 +391,97 @@ def parse_cascade(cascade_file: str) -> Dict:
     """
     parser = CascadeParser(cascade_file)
     return parser.parse()
+
+
+# Bytes hashed from each end of the file for the parse cache key
+_CACHE_KEY_SAMPLE = 4096
+
+# Bump when the cached layout of the parse result changes, so stale caches
+# are ignored
+_CACHE_VERSION = 3
+
+
+def _cache_dir() -> Path:
+    """Directory holding parse caches, private to the current user.
+
+    Uses ``$XDG_CACHE_HOME/program_nova/cascade`` (``~/.cache`` by default)
+    so nothing is written into, or read back from, the project tree.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'program_nova' / 'cascade'
+
+
+def _cascade_cache_key(cascade_file: str) -> List:
+    """Build the parse cache key for a cascade file.
+
+    The key combines the cache version, the file's absolute path, mtime,
+    size and a hash of the first and last 4 KiB, so any normal edit
+    invalidates it without hashing the whole file.
+    """
+    st = os.stat(cascade_file)
+    with open(cascade_file, 'rb') as f:
+        head = f.read(_CACHE_KEY_SAMPLE)
+        if st.st_size > 2 * _CACHE_KEY_SAMPLE:
+            f.seek(-_CACHE_KEY_SAMPLE, os.SEEK_END)
+        tail = f.read(_CACHE_KEY_SAMPLE)
+    digest = hashlib.blake2b(head + tail, digest_size=16).hexdigest()
+    path = os.path.abspath(cascade_file)
+    return [_CACHE_VERSION, path, st.st_mtime_ns, st.st_size, digest]
+
+
+def parse_cascade_cached(cascade_file: str) -> Dict:
+    """Parse a CASCADE.md file, reusing a cached parse while it is unchanged.
+
+    The project name, tasks and hierarchy are stored as JSON in a per-user
+    cache directory (see _cache_dir()), one file per cascade path. The
+    first line of the cache file is its key; the rest is only decoded when
+    that key matches the file's current path, mtime, size and content
+    sample. The DAG is rebuilt from the cached tasks. Cache read/write
+    failures fall back to a normal parse.
+
+    Args:
+        cascade_file: Path to CASCADE.md file
+
+    Returns:
+        Parsed cascade data (project_name, tasks, hierarchy, dag)
+    """
+    if not Path(cascade_file).exists():
+        raise FileNotFoundError(f"CASCADE file not found: {cascade_file}")
+
+    key = _cascade_cache_key(cascade_file)
+    key_line = json.dumps(key).encode() + b'\n'
+    cache_dir = _cache_dir()
+    name = hashlib.blake2b(key[1].encode(), digest_size=16).hexdigest()
+    cache_file = cache_dir / f"{name}.json"
+
+    try:
+        with open(cache_file, 'rb') as f:
+            if f.readline() == key_line:
+                cached = json.loads(f.read())
+                return {
+                    'project_name': cached['project_name'],
+                    'tasks': cached['tasks'],
+                    'hierarchy': cached['hierarchy'],
+                    'dag': DAG(cached['tasks']),
+                }
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    data = parse_cascade(cascade_file)
+
+    payload = {k: data[k] for k in ('project_name', 'tasks', 'hierarchy')}
+    tmp_file = cache_dir / f"{name}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            f.write(key_line)
+            f.write(json.dumps(payload).encode())
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Cache is best-effort (e.g. read-only home directory)
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+
+    return data
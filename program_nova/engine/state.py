@@ -1,15 +1,57 @@
 """State management for cascade execution.
 
 This module provides thread-safe read/write access to the cascade_state.json file
-using file locking to prevent corruption from concurrent access.
+using file locking to prevent corruption from concurrent access. Locks are held
+on a sibling cascade_state.lock file because writers atomically replace the
+state file rather than rewriting it in place.
+
+Writers may append small delta records to a write-ahead log next to the state
+file (cascade_state.wal) instead of rewriting the whole JSON document; readers
+always replay that log on top of the snapshot.
 """
 
+import asyncio
 import fcntl
-import json
+import mmap
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+from program_nova.engine import json_codec
+
+# The WAL is folded into the snapshot once it grows past this many bytes and
+# WAL_COMPACT_RATIO times the snapshot size
+WAL_COMPACT_MIN_BYTES = 64 * 1024
+WAL_COMPACT_RATIO = 10
+
+# Files modified more recently than this aren't cached by read_state(): a
+# later write within the filesystem's timestamp granularity could leave
+# mtime and size unchanged
+READ_CACHE_SETTLE_NS = 100_000_000
+
+# Lock-free read attempts before read_state() falls back to taking the lock
+OPTIMISTIC_READ_ATTEMPTS = 3
+
+# Bound once so the lock calls on every update skip the module attribute lookups
+_flock = fcntl.flock
+_LOCK_SH = fcntl.LOCK_SH
+_LOCK_EX = fcntl.LOCK_EX
+_LOCK_UN = fcntl.LOCK_UN
+
+
+def _non_none(**fields: Any) -> Dict[str, Any]:
+    """Return the keyword arguments whose value isn't None.
+
+    Mutators treat None as "leave unchanged", so this is the set of fields
+    an update actually changes.
+    """
+    return {key: value for key, value in fields.items() if value is not None}
 
 
 class TaskStatus(Enum):
@@ -58,34 +100,78 @@ class StateManager:
     }
     """
 
-    def __init__(self, state_file_path: str):
+    def __init__(
+        self,
+        state_file_path: str,
+        wal: bool = False,
+        cache_reads: bool = False,
+    ):
         """Initialize the StateManager.
 
         Args:
             state_file_path: Path to the cascade_state.json file
+            wal: If True, updates are appended to the write-ahead log instead
+                of rewriting the state file; the log is compacted into the
+                state file automatically as it grows, or with compact().
+            cache_reads: If True, read_state() returns the previously parsed
+                state while the state file and WAL are unchanged (same inode,
+                mtime and size). The returned dict is then shared between
+                calls and must not be modified.
         """
         self.state_file_path = Path(state_file_path)
+        self.wal_path = self.state_file_path.with_suffix(".wal")
+        # Writers replace the state file rather than rewriting it in place,
+        # so locks are taken on this sibling file, whose inode never changes
+        self.lock_path = self.state_file_path.with_suffix(".lock")
+        self._parent_ensured = False
+
+        # The lock file is opened once and kept open. flock doesn't exclude
+        # threads sharing one descriptor, so they also take _thread_lock
+        self._lock_fd: Optional[int] = None
+        self._thread_lock = threading.Lock()
+        self.use_wal = wal
+
+        # Delta records queued between begin_batch() and end_batch(); None
+        # when updates are written immediately
+        self._pending_updates: Optional[List[Dict[str, Any]]] = None
+
+        # Parsed state from the last read_state(), keyed on file metadata
+        self._cache_reads = cache_reads
+        self._read_cache: Optional[tuple] = None
+
+        # State as last written by this instance, keyed on the file metadata
+        # right after that write; reused by the next read-modify-write if
+        # nobody else has touched the files since
+        self._write_cache: Optional[tuple] = None
+
+    # Templates copied by _get_empty_task(); the nested token_usage dict and
+    # files_changed list are copied separately so tasks never share them
+    _EMPTY_TOKEN_USAGE = {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "cache_read_tokens": 0,
+        "cache_creation_tokens": 0,
+    }
+    _EMPTY_TASK_TEMPLATE = {
+        "status": TaskStatus.PENDING.value,
+        "worker_id": None,
+        "pid": None,
+        "started_at": None,
+        "completed_at": None,
+        "duration_seconds": 0,
+        "current_step": None,
+        "token_usage": None,
+        "error": None,
+        "commit_sha": None,
+        "files_changed": None,
+    }
 
     def _get_empty_task(self) -> Dict[str, Any]:
         """Return an empty task structure."""
-        return {
-            "status": TaskStatus.PENDING.value,
-            "worker_id": None,
-            "pid": None,
-            "started_at": None,
-            "completed_at": None,
-            "duration_seconds": 0,
-            "current_step": None,
-            "token_usage": {
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "cache_read_tokens": 0,
-                "cache_creation_tokens": 0,
-            },
-            "error": None,
-            "commit_sha": None,
-            "files_changed": [],
-        }
+        task = self._EMPTY_TASK_TEMPLATE.copy()
+        task["token_usage"] = self._EMPTY_TOKEN_USAGE.copy()
+        task["files_changed"] = []
+        return task
 
     def _get_empty_state(
         self, project_name: str, cascade_file: str
@@ -122,6 +208,10 @@ class StateManager:
     def read_state(self) -> Dict[str, Any]:
         """Read the current state from the file.
 
+        Any write-ahead log entries are replayed on top of the snapshot.
+        The read doesn't take the lock unless concurrent writes keep
+        changing the files while it runs.
+
         Returns:
             The current state dictionary
 
@@ -134,52 +224,284 @@ class StateManager:
                 f"State file not found: {self.state_file_path}"
             )
 
-        with open(self.state_file_path, "r") as f:
-            # Acquire shared lock for reading
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+        # Read without locking: the snapshot is only ever replaced whole, so
+        # the read is consistent if the files' metadata didn't change under it
+        for _ in range(OPTIMISTIC_READ_ATTEMPTS):
+            key = self._file_key()
+            cached = self._read_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
             try:
-                state = json.load(f)
+                state = self._load_locked()
+            except ValueError:
+                if self._file_key() == key:
+                    raise
+                continue
+
+            if self._file_key() == key:
+                if self._cache_reads and self._is_settled(key):
+                    self._read_cache = (key, state)
+                return state
+
+        # Writers kept changing the files under us; wait for them instead
+        with self._lock(_LOCK_SH):
+            return self._load_locked()
+
+    @contextmanager
+    def _lock(self, mode: int) -> Iterator[int]:
+        """Hold an flock on the lock file for the duration of the block.
+
+        Args:
+            mode: _LOCK_SH or _LOCK_EX
+
+        Yields:
+            The lock file descriptor, so the caller can change the lock mode
+        """
+        with self._thread_lock:
+            fd = self._lock_fd
+            if fd is None:
+                fd = self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                weakref.finalize(self, os.close, fd)
+            _flock(fd, mode)
+            try:
+                yield fd
             finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                _flock(fd, _LOCK_UN)
+
+    def export_pretty(self, path: str) -> None:
+        """Write the current state to path as indented JSON for debugging.
+
+        The state file itself is stored compact; use this to get a copy
+        that is easier to read or diff.
+
+        Args:
+            path: Destination file
+        """
+        Path(path).write_bytes(json_codec.dumps_bytes(self.read_state(), indent=True))
+
+    async def read_state_async(self) -> Dict[str, Any]:
+        """Read the current state without blocking the event loop.
+
+        Runs read_state() in a worker thread so the file I/O and lock wait
+        don't stall other requests in an async server.
+
+        Returns:
+            The current state dictionary
+        """
+        return await asyncio.to_thread(self.read_state)
+
+    def _file_key(self) -> tuple:
+        """Identify the current contents of the state file and WAL by metadata."""
+        st = os.stat(self.state_file_path)
+        try:
+            wal_st = os.stat(self.wal_path)
+            wal_key = (wal_st.st_ino, wal_st.st_mtime_ns, wal_st.st_size)
+        except FileNotFoundError:
+            wal_key = None
+        return (st.st_ino, st.st_mtime_ns, st.st_size), wal_key
+
+    @staticmethod
+    def _is_settled(key: tuple) -> bool:
+        """Whether the files are old enough for their metadata to identify them."""
+        cutoff = time.time_ns() - READ_CACHE_SETTLE_NS
+        return all(part is None or part[1] < cutoff for part in key)
+
+    def _load_locked(self) -> Dict[str, Any]:
+        """Parse the snapshot and replay the WAL.
+
+        The caller either holds the lock or checks _file_key() around the
+        call to detect a concurrent compaction.
+        """
+        # Parse straight from a read-only mapping instead of copying the
+        # file into a bytes object first
+        with open(self.state_file_path, "rb") as f:
+            fd = f.fileno()
+            if os.fstat(fd).st_size:
+                with mmap.mmap(fd, 0, prot=mmap.PROT_READ) as mm, memoryview(mm) as view:
+                    state = json_codec.loads(view)
+            else:
+                state = json_codec.loads(b"")
+
+        try:
+            with open(self.wal_path, "rb") as wal:
+                for line in wal:
+                    try:
+                        delta = json_codec.loads(line)
+                    except ValueError:
+                        # Torn final record from an interrupted writer
+                        break
+                    self._apply_delta(state, delta)
+        except FileNotFoundError:
+            pass
 
         return state
 
+    def _store_locked(self, state: Dict[str, Any]) -> None:
+        """Replace the snapshot and empty the WAL; caller holds LOCK_EX."""
+        # Write a complete new file and rename it over the old one, so a
+        # crash mid-write can never leave a truncated state file behind
+        tmp_path = self.state_file_path.with_name(
+            f"{self.state_file_path.name}.tmp.{os.getpid()}"
+        )
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json_codec.dumps_bytes(state))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.state_file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Deltas are idempotent, so a crash before this truncate only
+        # replays them again on top of the new snapshot
+        if self.wal_path.exists():
+            os.truncate(self.wal_path, 0)
+
     def _write_state(self, state: Dict[str, Any]) -> None:
         """Write state to the file with exclusive locking.
 
         Args:
             state: The state dictionary to write
         """
-        # Create parent directory if it doesn't exist
-        self.state_file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create parent directory if it doesn't exist (once per instance)
+        if not self._parent_ensured:
+            self.state_file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._parent_ensured = True
 
-        # Write with exclusive lock
-        with open(self.state_file_path, "w") as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                json.dump(state, f, indent=2)
-                f.flush()
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        with self._lock(_LOCK_EX):
+            self._store_locked(state)
+
+    def _apply_delta(self, state: Dict[str, Any], delta: Dict[str, Any]) -> None:
+        """Apply one delta record to a state dict in-place.
 
-    def _update_state(self, updater_fn) -> None:
-        """Read, modify, and write state atomically.
+        A delta holds a task ID with fields to set ("set") and token counts
+        to set ("tokens"), and/or project fields to set ("project").
+        """
+        task_id = delta.get("task")
+        if task_id is not None:
+            tasks = state["tasks"]
+            task = tasks.get(task_id)
+            if task is None:
+                task = tasks[task_id] = self._get_empty_task()
+            if "set" in delta:
+                task.update(delta["set"])
+            if "tokens" in delta:
+                task["token_usage"].update(delta["tokens"])
+
+        if "project" in delta:
+            state["project"].update(delta["project"])
+
+    def _update_state(self, delta: Dict[str, Any]) -> None:
+        """Apply a delta record to the state file.
+
+        Inside begin_batch()/end_batch() (or batch()), the delta is queued
+        instead and applied with the rest of the batch.
 
         Args:
-            updater_fn: Function that takes state dict and modifies it in-place
+            delta: Delta record (see _apply_delta)
         """
-        # Use exclusive lock for read-modify-write
-        with open(self.state_file_path, "r+") as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                state = json.load(f)
-                updater_fn(state)
-                f.seek(0)
-                f.truncate()
-                json.dump(state, f, indent=2)
-                f.flush()
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        if self._pending_updates is not None:
+            self._pending_updates.append(delta)
+            return
+
+        self.apply_batch([delta])
+
+    def apply_batch(self, deltas: List[Dict[str, Any]]) -> None:
+        """Apply several delta records in order as one write.
+
+        With the WAL enabled the records are appended to the log in a single
+        O_APPEND write under a shared lock, so appends don't wait for readers
+        (or other appenders); the lock is only upgraded to exclusive when the
+        log has grown enough to compact. Otherwise the state file is
+        replaced with a single read-modify-write under an exclusive lock.
+        That rewrite starts from the state this instance last wrote when the
+        files are unchanged since, so the JSON isn't parsed again.
+
+        Args:
+            deltas: Delta records (see _apply_delta)
+        """
+        if not deltas:
+            return
+
+        if not self.state_file_path.exists():
+            raise FileNotFoundError(
+                f"State file not found: {self.state_file_path}"
+            )
+
+        if self.use_wal:
+            record = b"".join(
+                json_codec.dumps_bytes(delta) + b"\n" for delta in deltas
+            )
+            with self._lock(_LOCK_SH) as lock_fd:
+                with open(self.wal_path, "ab", buffering=0) as wal:
+                    wal.write(record)
+
+                if self._wal_needs_compaction():
+                    _flock(lock_fd, _LOCK_EX)
+                    # Another writer may have compacted while we upgraded
+                    if self._wal_needs_compaction():
+                        self._store_locked(self._load_locked())
+            return
+
+        with self._lock(_LOCK_EX):
+            cached, self._write_cache = self._write_cache, None
+            if cached is not None and cached[0] == self._file_key():
+                state = cached[1]
+            else:
+                state = self._load_locked()
+            for delta in deltas:
+                self._apply_delta(state, delta)
+            self._store_locked(state)
+            self._write_cache = (self._file_key(), state)
+
+    def _wal_needs_compaction(self) -> bool:
+        """Whether the WAL has outgrown the snapshot."""
+        try:
+            wal_size = os.stat(self.wal_path).st_size
+        except FileNotFoundError:
+            return False
+        snapshot_size = os.stat(self.state_file_path).st_size
+        return wal_size > max(WAL_COMPACT_MIN_BYTES, WAL_COMPACT_RATIO * snapshot_size)
+
+    def compact(self) -> None:
+        """Fold the write-ahead log into the state file and empty the log."""
+        with self._lock(_LOCK_EX):
+            self._store_locked(self._load_locked())
+
+    def begin_batch(self) -> None:
+        """Start queuing updates instead of writing each one immediately.
+
+        Updates made through this instance are held until end_batch(), which
+        writes them all with one lock acquisition.
+        Reads are unaffected and won't see queued updates.
+        """
+        if self._pending_updates is None:
+            self._pending_updates = []
+
+    def end_batch(self) -> None:
+        """Write all updates queued since begin_batch() and stop queuing."""
+        deltas, self._pending_updates = self._pending_updates, None
+        if deltas:
+            self.apply_batch(deltas)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Queue updates made in the block and write them as one batch on exit.
+
+        Queued updates are written even if the block raises. A nested
+        batch() joins the enclosing one, which does the write.
+        """
+        if self._pending_updates is not None:
+            yield
+            return
+
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
 
     def update_task(
         self,
@@ -200,25 +522,14 @@ class StateManager:
             started_at: Start timestamp ISO format (if provided)
             current_step: Current activity description (if provided)
         """
-
-        def updater(state):
-            if task_id not in state["tasks"]:
-                state["tasks"][task_id] = self._get_empty_task()
-
-            task = state["tasks"][task_id]
-
-            if status is not None:
-                task["status"] = status.value
-            if worker_id is not None:
-                task["worker_id"] = worker_id
-            if pid is not None:
-                task["pid"] = pid
-            if started_at is not None:
-                task["started_at"] = started_at
-            if current_step is not None:
-                task["current_step"] = current_step
-
-        self._update_state(updater)
+        fields = _non_none(
+            status=status.value if status is not None else None,
+            worker_id=worker_id,
+            pid=pid,
+            started_at=started_at,
+            current_step=current_step,
+        )
+        self._update_state({"task": task_id, "set": fields})
 
     def update_task_tokens(
         self,
@@ -237,23 +548,13 @@ class StateManager:
             cache_read_tokens: Cache read tokens (if provided)
             cache_creation_tokens: Cache creation tokens (if provided)
         """
-
-        def updater(state):
-            if task_id not in state["tasks"]:
-                state["tasks"][task_id] = self._get_empty_task()
-
-            tokens = state["tasks"][task_id]["token_usage"]
-
-            if input_tokens is not None:
-                tokens["input_tokens"] = input_tokens
-            if output_tokens is not None:
-                tokens["output_tokens"] = output_tokens
-            if cache_read_tokens is not None:
-                tokens["cache_read_tokens"] = cache_read_tokens
-            if cache_creation_tokens is not None:
-                tokens["cache_creation_tokens"] = cache_creation_tokens
-
-        self._update_state(updater)
+        tokens = _non_none(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_creation_tokens=cache_creation_tokens,
+        )
+        self._update_state({"task": task_id, "tokens": tokens})
 
     def complete_task(
         self,
@@ -272,22 +573,11 @@ class StateManager:
             commit_sha: Git commit SHA (if available)
             files_changed: List of changed files (if available)
         """
-
-        def updater(state):
-            if task_id not in state["tasks"]:
-                state["tasks"][task_id] = self._get_empty_task()
-
-            task = state["tasks"][task_id]
-            task["status"] = TaskStatus.COMPLETED.value
-            task["completed_at"] = completed_at
-            task["duration_seconds"] = duration_seconds
-
-            if commit_sha is not None:
-                task["commit_sha"] = commit_sha
-            if files_changed is not None:
-                task["files_changed"] = files_changed
-
-        self._update_state(updater)
+        fields = _non_none(commit_sha=commit_sha, files_changed=files_changed)
+        fields["status"] = TaskStatus.COMPLETED.value
+        fields["completed_at"] = completed_at
+        fields["duration_seconds"] = duration_seconds
+        self._update_state({"task": task_id, "set": fields})
 
     def fail_task(self, task_id: str, error: str) -> None:
         """Mark a task as failed.
@@ -296,17 +586,14 @@ class StateManager:
             task_id: The task identifier
             error: Error message describing the failure
         """
-
-        def updater(state):
-            if task_id not in state["tasks"]:
-                state["tasks"][task_id] = self._get_empty_task()
-
-            task = state["tasks"][task_id]
-            task["status"] = TaskStatus.FAILED.value
-            task["error"] = error
-            task["completed_at"] = datetime.now(timezone.utc).isoformat()
-
-        self._update_state(updater)
+        self._update_state({
+            "task": task_id,
+            "set": {
+                "status": TaskStatus.FAILED.value,
+                "error": error,
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+            },
+        })
 
     def update_project(
         self,
@@ -319,11 +606,5 @@ class StateManager:
             started_at: Project start timestamp ISO format (if provided)
             completed_at: Project completion timestamp ISO format (if provided)
         """
-
-        def updater(state):
-            if started_at is not None:
-                state["project"]["started_at"] = started_at
-            if completed_at is not None:
-                state["project"]["completed_at"] = completed_at
-
-        self._update_state(updater)
+        fields = _non_none(started_at=started_at, completed_at=completed_at)
+        self._update_state({"project": fields})
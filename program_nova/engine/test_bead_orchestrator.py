@@ -9,16 +9,43 @@ Tests verify that the orchestrator correctly:
 """
 
 import json
+import os
+import shlex
 import subprocess
 import threading
+from collections import namedtuple
 from pathlib import Path
 from unittest.mock import Mock, patch, call, MagicMock
 import pytest
 
-from program_nova.engine.bead_orchestrator import BeadOrchestrator, compute_cost_from_tokens
+from program_nova.engine.bead_orchestrator import (
+    BeadOrchestrator,
+    _spawn_options,
+    compute_cost_from_tokens,
+)
 from program_nova.engine.worker import Worker, WorkerStatus
 
 
+# Stand-in for a completed bd query; lighter than a Mock per result
+_BdResult = namedtuple("_BdResult", "stdout returncode")
+
+
+def bd_result(payload) -> _BdResult:
+    """Return a successful bd query result whose stdout is payload as JSON bytes."""
+    return _BdResult(stdout=json.dumps(payload).encode(), returncode=0)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run each test from its own directory.
+
+    BeadOrchestrator looks for a .beads store upwards from the cwd; without
+    this, the released-task check would key on the repository's real store
+    and tests could not run in parallel safely.
+    """
+    monkeypatch.chdir(tmp_path)
+
+
 class TestComputeCost:
     """Test cost computation from token usage."""
 
@@ -48,6 +75,34 @@ class TestComputeCost:
         assert abs(cost - 0.01485) < 1e-10
 
 
+class TestBdSpawn:
+    """Test how bd subprocesses are started."""
+
+    @pytest.mark.skipif(
+        not subprocess._USE_POSIX_SPAWN, reason="posix_spawn not used on this platform"
+    )
+    def test_bd_call_uses_posix_spawn(self, tmp_path, monkeypatch):
+        """Test that bd queries take subprocess's posix_spawn() fast path."""
+        fake_bd = tmp_path / "bd"
+        fake_bd.write_text("#!/bin/sh\necho '[]'\n")
+        fake_bd.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+        _spawn_options.cache_clear()
+
+        posix_spawn = subprocess.Popen._posix_spawn
+        try:
+            with patch.object(
+                subprocess.Popen, "_posix_spawn", autospec=True, side_effect=posix_spawn
+            ) as spy:
+                assert BeadOrchestrator("Nova-gyd").get_ready_tasks() == []
+            assert _spawn_options("bd") == {"close_fds": False, "executable": str(fake_bd)}
+        finally:
+            # Don't leave the fake bd path cached for later tests
+            _spawn_options.cache_clear()
+
+        spy.assert_called_once()
+
+
 class TestBeadOrchestrator:
     """Test BeadOrchestrator initialization and task management."""
 
@@ -57,6 +112,13 @@ class TestBeadOrchestrator:
         with patch("subprocess.run") as mock_run:
             yield mock_run
 
+    @pytest.fixture(autouse=True)
+    def mock_subprocess_popen(self):
+        """Mock subprocess.Popen for fire-and-forget bd writes."""
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value.returncode = 0
+            yield mock_popen
+
     @pytest.fixture
     def sample_graph_data(self):
         """Sample bead graph data."""
@@ -106,13 +168,11 @@ class TestBeadOrchestrator:
         """Test BeadOrchestrator initialization."""
         orch = BeadOrchestrator("Nova-gyd")
         assert orch.epic_id == "Nova-gyd"
-        assert orch.active_workers == {}
+        assert orch.active == {}
 
     def test_get_tasks(self, mock_subprocess_run, sample_graph_data):
         """Test getting tasks from bead graph."""
-        mock_subprocess_run.return_value = Mock(
-            stdout=json.dumps(sample_graph_data)
-        )
+        mock_subprocess_run.return_value = bd_result(sample_graph_data)
 
         orch = BeadOrchestrator("Nova-gyd")
         tasks = orch.get_tasks()
@@ -121,7 +181,7 @@ class TestBeadOrchestrator:
         mock_subprocess_run.assert_called_once_with(
             ["bd", "graph", "Nova-gyd", "--json"],
             capture_output=True,
-            text=True
+            **_spawn_options("bd")
         )
 
         # Should return tasks excluding the epic itself
@@ -162,7 +222,7 @@ class TestBeadOrchestrator:
                 "Layers": [["Nova-gyd"], ["Nova-gyd.1"]]
             }
         }
-        mock_subprocess_run.return_value = Mock(stdout=json.dumps(graph_data))
+        mock_subprocess_run.return_value = bd_result(graph_data)
 
         orch = BeadOrchestrator("Nova-gyd")
         tasks = orch.get_tasks()
@@ -174,9 +234,10 @@ class TestBeadOrchestrator:
         ready_data = [
             {"id": "Nova-gyd.1", "title": "Ready Task 1"},
             {"id": "Nova-xyz.1", "title": "Other Epic Task"},
+            {"id": "Nova-gydx.1", "title": "Epic With Shared Prefix"},
             {"id": "Nova-gyd.3", "title": "Ready Task 2"}
         ]
-        mock_subprocess_run.return_value = Mock(stdout=json.dumps(ready_data))
+        mock_subprocess_run.return_value = bd_result(ready_data)
 
         orch = BeadOrchestrator("Nova-gyd")
         ready = orch.get_ready_tasks()
@@ -185,7 +246,7 @@ class TestBeadOrchestrator:
         mock_subprocess_run.assert_called_once_with(
             ["bd", "ready", "--json"],
             capture_output=True,
-            text=True
+            **_spawn_options("bd")
         )
 
         # Should only return tasks from our epic
@@ -193,9 +254,12 @@ class TestBeadOrchestrator:
         assert "Nova-gyd.1" in ready
         assert "Nova-gyd.3" in ready
         assert "Nova-xyz.1" not in ready
+        assert "Nova-gydx.1" not in ready
 
     @patch("program_nova.engine.bead_orchestrator.Worker")
-    def test_start_worker(self, mock_worker_class, mock_subprocess_run):
+    def test_start_worker(
+        self, mock_worker_class, mock_subprocess_run, mock_subprocess_popen
+    ):
         """Test starting a worker for a bead task."""
         # Mock bd show output
         bead_data = [{
@@ -204,7 +268,7 @@ class TestBeadOrchestrator:
             "description": "Task description",
             "status": "open"
         }]
-        mock_subprocess_run.return_value = Mock(stdout=json.dumps(bead_data))
+        mock_subprocess_run.return_value = bd_result(bead_data)
 
         # Mock Worker instance
         mock_worker = Mock()
@@ -213,16 +277,18 @@ class TestBeadOrchestrator:
         orch = BeadOrchestrator("Nova-gyd")
         orch.start_worker("Nova-gyd.1")
 
-        # Should update bead to in_progress
-        assert mock_subprocess_run.call_args_list[0] == call(
-            ["bd", "update", "Nova-gyd.1", "--status=in_progress"]
+        # Should update bead to in_progress without waiting on it
+        mock_subprocess_popen.assert_called_once_with(
+            ["bd", "update", "Nova-gyd.1", "--status=in_progress"],
+            stdout=subprocess.DEVNULL,
+            **_spawn_options("bd")
         )
 
         # Should fetch bead details
-        assert mock_subprocess_run.call_args_list[1] == call(
+        assert mock_subprocess_run.call_args_list[0] == call(
             ["bd", "show", "Nova-gyd.1", "--json"],
             capture_output=True,
-            text=True
+            **_spawn_options("bd")
         )
 
         # Should create worker with correct task ID and description
@@ -243,7 +309,7 @@ class TestBeadOrchestrator:
         mock_worker.start.assert_called_once_with(expected_command)
 
         # Should track active worker
-        assert orch.active_workers["Nova-gyd.1"] == mock_worker
+        assert orch.active["Nova-gyd.1"].worker == mock_worker
 
     @patch("program_nova.engine.bead_orchestrator.Worker")
     def test_start_worker_uses_title_if_no_description(
@@ -256,7 +322,7 @@ class TestBeadOrchestrator:
             "description": "",
             "status": "open"
         }]
-        mock_subprocess_run.return_value = Mock(stdout=json.dumps(bead_data))
+        mock_subprocess_run.return_value = bd_result(bead_data)
 
         mock_worker = Mock()
         mock_worker_class.return_value = mock_worker
@@ -270,8 +336,105 @@ class TestBeadOrchestrator:
             task_description="Task Title Only"
         )
 
+    @patch("program_nova.engine.bead_orchestrator.Worker")
+    def test_start_worker_reuses_graph_description(
+        self, mock_worker_class, mock_subprocess_run, mock_subprocess_popen,
+        sample_graph_data
+    ):
+        """Test that start_worker skips bd show once the graph is loaded."""
+        mock_subprocess_run.return_value = bd_result(sample_graph_data)
+        mock_worker_class.return_value = Mock()
+
+        orch = BeadOrchestrator("Nova-gyd")
+        orch.get_tasks()
+        mock_subprocess_run.reset_mock()
+
+        orch.start_worker("Nova-gyd.2")
+
+        # Only the status update should hit bd
+        mock_subprocess_run.assert_not_called()
+        mock_subprocess_popen.assert_called_once_with(
+            ["bd", "update", "Nova-gyd.2", "--status=in_progress"],
+            stdout=subprocess.DEVNULL,
+            **_spawn_options("bd")
+        )
+        mock_worker_class.assert_called_once_with(
+            task_id="Nova-gyd.2",
+            task_description="Second task"
+        )
+
+    @patch("program_nova.engine.bead_orchestrator.Worker")
+    def test_start_workers_batches_bd_calls(
+        self, mock_worker_class, mock_subprocess_run, mock_subprocess_popen
+    ):
+        """Test that starting several workers uses one bd update and one bd show."""
+        mock_subprocess_run.return_value = bd_result([
+            {"id": "Nova-gyd.1", "title": "Task 1", "description": "First task"},
+            {"id": "Nova-gyd.2", "title": "Task 2", "description": ""},
+        ])
+        mock_worker_class.side_effect = [Mock(), Mock()]
+
+        orch = BeadOrchestrator("Nova-gyd")
+        orch.start_workers(["Nova-gyd.1", "Nova-gyd.2"])
+
+        mock_subprocess_popen.assert_called_once_with(
+            ["bd", "update", "Nova-gyd.1", "Nova-gyd.2", "--status=in_progress"],
+            stdout=subprocess.DEVNULL,
+            **_spawn_options("bd")
+        )
+        mock_subprocess_run.assert_called_once_with(
+            ["bd", "show", "Nova-gyd.1", "Nova-gyd.2", "--json"],
+            capture_output=True,
+            **_spawn_options("bd")
+        )
+        assert mock_worker_class.call_args_list == [
+            call(task_id="Nova-gyd.1", task_description="First task"),
+            call(task_id="Nova-gyd.2", task_description="Task 2"),
+        ]
+        assert set(orch.active) == {"Nova-gyd.1", "Nova-gyd.2"}
+
+        # A later write to either bead waits for the shared update
+        orch._bd_write("Nova-gyd.2", "close", "Nova-gyd.2")
+        mock_subprocess_popen.return_value.wait.assert_called()
+
+    def test_bd_writes_to_same_bead_are_ordered(self, mock_subprocess_popen):
+        """Test that a bd write waits for an earlier write to the same bead only."""
+        first, other, second = (Mock(returncode=0) for _ in range(3))
+        mock_subprocess_popen.side_effect = [first, other, second]
+
+        orch = BeadOrchestrator("Nova-gyd")
+        orch._bd_write("Nova-gyd.1", "update", "Nova-gyd.1", "--status=in_progress")
+        orch._bd_write("Nova-gyd.2", "update", "Nova-gyd.2", "--status=in_progress")
+        orch._bd_write("Nova-gyd.1", "close", "Nova-gyd.1")
+
+        first.wait.assert_called_once()
+        other.wait.assert_not_called()
+
+        orch.flush_writes()
+        assert orch._pending_writes == []
+        second.wait.assert_called_once()
+
+    def test_failed_bd_write_is_logged(self, mock_subprocess_popen, caplog):
+        """Test that a bd write exiting non-zero is logged when reaped or flushed."""
+        update = Mock(returncode=0, args=["bd", "update", "Nova-gyd.1", "Nova-gyd.2"])
+        update.poll.return_value = 0
+        close = Mock(returncode=1, args=["bd", "close", "Nova-gyd.1"])
+        mock_subprocess_popen.side_effect = [update, close]
+
+        orch = BeadOrchestrator("Nova-gyd")
+        orch._spawn_write(["Nova-gyd.1", "Nova-gyd.2"], update.args)
+        with caplog.at_level("ERROR", logger="program_nova.engine.bead_orchestrator"):
+            orch._reap_writes()
+            assert caplog.records == []
+
+            orch._bd_write("Nova-gyd.1", "close", "Nova-gyd.1")
+            orch.flush_writes()
+
+        assert len(caplog.records) == 1
+        assert "exit code 1: bd close Nova-gyd.1" in caplog.records[0].getMessage()
+
     @patch("program_nova.engine.bead_orchestrator.time.time")
-    def test_complete_task(self, mock_time, mock_subprocess_run):
+    def test_complete_task(self, mock_time, mock_subprocess_popen):
         """Test completing a task and storing metrics."""
         # Mock time for duration calculation
         mock_time.return_value = 1045.5  # end time
@@ -286,17 +449,20 @@ class TestBeadOrchestrator:
         }
 
         orch = BeadOrchestrator("Nova-gyd")
-        # Simulate starting the task to record start time
-        orch.task_start_times["Nova-gyd.1"] = 1000.0
-        orch.complete_task("Nova-gyd.1", mock_worker)
+        # Task started at 1000.0
+        orch.complete_task("Nova-gyd.1", mock_worker, start_time=1000.0)
 
         # Verify the metrics comment was added
         # Duration should be 45 seconds (int(45.5))
-        call_args = mock_subprocess_run.call_args_list[0]
-        assert call_args[0][0][:4] == ["bd", "comments", "add", "Nova-gyd.1"]
+        # Comment and close run as one background job
+        mock_subprocess_popen.assert_called_once()
+        command = mock_subprocess_popen.call_args[0][0]
+        assert command[:2] == ["sh", "-c"]
+        tokens = shlex.split(command[2])
+        assert tokens[:4] == ["bd", "comments", "add", "Nova-gyd.1"]
 
         # Parse the metrics from the comment
-        metrics_json = call_args[0][0][4]
+        metrics_json = tokens[4]
         metrics = json.loads(metrics_json)
 
         # Verify metrics structure and values
@@ -306,16 +472,11 @@ class TestBeadOrchestrator:
         assert abs(metrics["cost_usd"] - 0.0105) < 1e-10
         assert metrics["duration_seconds"] == 45
 
-        # Should close the bead
-        assert mock_subprocess_run.call_args_list[1] == call(
-            ["bd", "close", "Nova-gyd.1"]
-        )
-
-        # Should clean up start time
-        assert "Nova-gyd.1" not in orch.task_start_times
+        # Should close the bead after commenting
+        assert tokens[5:] == [";", "bd", "close", "Nova-gyd.1"]
 
     @patch("program_nova.engine.bead_orchestrator.time.time")
-    def test_complete_task_with_cache_tokens(self, mock_time, mock_subprocess_run):
+    def test_complete_task_with_cache_tokens(self, mock_time, mock_subprocess_popen):
         """Test completing a task with cache tokens."""
         # Mock time for duration calculation
         mock_time.return_value = 1120.0  # end time
@@ -329,17 +490,20 @@ class TestBeadOrchestrator:
         }
 
         orch = BeadOrchestrator("Nova-gyd")
-        # Simulate starting the task to record start time
-        orch.task_start_times["Nova-gyd.1"] = 1000.0
-        orch.complete_task("Nova-gyd.1", mock_worker)
+        # Task started at 1000.0
+        orch.complete_task("Nova-gyd.1", mock_worker, start_time=1000.0)
 
         # Verify the metrics comment was added
         # Duration should be 120 seconds (int(120.0))
-        call_args = mock_subprocess_run.call_args_list[0]
-        assert call_args[0][0][:4] == ["bd", "comments", "add", "Nova-gyd.1"]
+        # Comment and close run as one background job
+        mock_subprocess_popen.assert_called_once()
+        command = mock_subprocess_popen.call_args[0][0]
+        assert command[:2] == ["sh", "-c"]
+        tokens = shlex.split(command[2])
+        assert tokens[:4] == ["bd", "comments", "add", "Nova-gyd.1"]
 
         # Parse the metrics from the comment
-        metrics_json = call_args[0][0][4]
+        metrics_json = tokens[4]
         metrics = json.loads(metrics_json)
 
         # Verify cost includes cache tokens
@@ -368,35 +532,28 @@ class TestBeadOrchestrator:
             [],  # Second call: no more tasks
         ]
 
-        # Mock bd show responses for both tasks
-        bead_responses = [
-            [{"id": "Nova-gyd.1", "title": "Task 1", "description": "First task", "status": "open"}],
-            [{"id": "Nova-gyd.3", "title": "Task 3", "description": "Third task", "status": "open"}],
-        ]
+        # Mock bd graph response supplying both task descriptions
+        graph_data = {
+            "issues": [
+                {"id": "Nova-gyd", "title": "Test Epic", "status": "open"},
+                {"id": "Nova-gyd.1", "title": "Task 1", "description": "First task", "status": "open"},
+                {"id": "Nova-gyd.3", "title": "Task 3", "description": "Third task", "status": "open"},
+            ],
+            "layout": {
+                "Nodes": {
+                    "Nova-gyd": {"DependsOn": []},
+                    "Nova-gyd.1": {"DependsOn": []},
+                    "Nova-gyd.3": {"DependsOn": []},
+                }
+            }
+        }
 
         # Setup mock responses in order
         mock_subprocess_run.side_effect = [
-            # First iteration: get_ready_tasks call
-            Mock(stdout=json.dumps(ready_tasks_responses[0])),
-            # bd update for Nova-gyd.1
-            Mock(returncode=0),
-            # bd show for Nova-gyd.1
-            Mock(stdout=json.dumps(bead_responses[0])),
-            # bd update for Nova-gyd.3
-            Mock(returncode=0),
-            # bd show for Nova-gyd.3
-            Mock(stdout=json.dumps(bead_responses[1])),
-            # Workers complete, so complete_task is called twice
-            # bd comments add for Nova-gyd.1
-            Mock(returncode=0),
-            # bd close for Nova-gyd.1
-            Mock(returncode=0),
-            # bd comments add for Nova-gyd.3
-            Mock(returncode=0),
-            # bd close for Nova-gyd.3
-            Mock(returncode=0),
-            # Second iteration: get_ready_tasks returns empty
-            Mock(stdout=json.dumps(ready_tasks_responses[1])),
+            # First iteration: bd graph loads task descriptions
+            bd_result(graph_data),
+            # get_ready_tasks call
+            bd_result(ready_tasks_responses[0]),
         ]
 
         # Mock Worker instances
@@ -458,34 +615,29 @@ class TestBeadOrchestrator:
             {"id": "Nova-gyd.3"}
         ]
 
-        # Mock bd show for first 2 tasks (max_workers=2)
-        bead_responses = [
-            [{"id": "Nova-gyd.1", "title": "Task 1", "description": "First", "status": "open"}],
-            [{"id": "Nova-gyd.2", "title": "Task 2", "description": "Second", "status": "open"}],
-        ]
+        # Mock bd graph supplying descriptions for all 3 tasks
+        graph_data = {
+            "issues": [
+                {"id": "Nova-gyd", "title": "Test Epic", "status": "open"},
+                {"id": "Nova-gyd.1", "title": "Task 1", "description": "First", "status": "open"},
+                {"id": "Nova-gyd.2", "title": "Task 2", "description": "Second", "status": "open"},
+                {"id": "Nova-gyd.3", "title": "Task 3", "description": "Third", "status": "open"},
+            ],
+            "layout": {
+                "Nodes": {
+                    "Nova-gyd": {"DependsOn": []},
+                    "Nova-gyd.1": {"DependsOn": []},
+                    "Nova-gyd.2": {"DependsOn": []},
+                    "Nova-gyd.3": {"DependsOn": []},
+                }
+            }
+        }
 
         mock_subprocess_run.side_effect = [
+            # bd graph
+            bd_result(graph_data),
             # get_ready_tasks
-            Mock(stdout=json.dumps(ready_tasks_response)),
-            # bd update for task 1
-            Mock(returncode=0),
-            # bd show for task 1
-            Mock(stdout=json.dumps(bead_responses[0])),
-            # bd update for task 2
-            Mock(returncode=0),
-            # bd show for task 2
-            Mock(stdout=json.dumps(bead_responses[1])),
-            # Workers complete, so complete_task is called twice
-            # bd comments add for task 1
-            Mock(returncode=0),
-            # bd close for task 1
-            Mock(returncode=0),
-            # bd comments add for task 2
-            Mock(returncode=0),
-            # bd close for task 2
-            Mock(returncode=0),
-            # Second iteration: get_ready_tasks returns empty
-            Mock(stdout="[]"),
+            bd_result(ready_tasks_response),
         ]
 
         # Mock workers
@@ -503,11 +655,179 @@ class TestBeadOrchestrator:
 
         # Create orchestrator with max_workers=2
         orch = BeadOrchestrator("Nova-gyd", max_workers=2)
-        orch.start(check_interval=0.1, max_iterations=2)
+        orch.start(check_interval=0.1, max_iterations=1)
 
         # Should only start 2 workers even though 3 tasks were ready
         assert mock_worker_class.call_count == 2
 
+    @patch("program_nova.engine.bead_orchestrator.Worker")
+    @patch("program_nova.engine.bead_orchestrator.time")
+    def test_start_tracks_ready_tasks_locally(
+        self, mock_time, mock_worker_class, mock_subprocess_run, sample_graph_data
+    ):
+        """Test that start() queries bd ready once and releases dependents locally."""
+        mock_time.time.return_value = 1000.0
+
+        mock_subprocess_run.side_effect = [
+            # bd graph
+            bd_result(sample_graph_data),
+            # bd ready: only the task without dependencies
+            bd_result([{"id": "Nova-gyd.1"}]),
+        ]
+
+        workers = []
+        for _ in range(2):
+            worker = Mock()
+            worker.is_alive.return_value = False
+            worker.wait.return_value = 0
+            worker.get_token_usage.return_value = {}
+            workers.append(worker)
+        mock_worker_class.side_effect = workers
+
+        orch = BeadOrchestrator("Nova-gyd")
+        orch.start(check_interval=0.1, max_iterations=5)
+
+        # Nova-gyd.2 became ready when Nova-gyd.1 closed, without a second bd ready
+        started = [c.kwargs["task_id"] for c in mock_worker_class.call_args_list]
+        assert started == ["Nova-gyd.1", "Nova-gyd.2"]
+        ready_calls = [
+            c for c in mock_subprocess_run.call_args_list
+            if c.args[0][:2] == ["bd", "ready"]
+        ]
+        assert len(ready_calls) == 1
+
+    def test_dependents_released_after_last_dependency(self, mock_subprocess_run):
+        """Test that a task joins the ready set only once all its in-epic deps close."""
+        graph_data = {
+            "issues": [
+                {"id": "Nova-gyd", "title": "Test Epic", "status": "open"},
+                {"id": "Nova-gyd.1", "title": "Task 1", "status": "open"},
+                {"id": "Nova-gyd.2", "title": "Task 2", "status": "open"},
+                {"id": "Nova-gyd.3", "title": "Task 3", "status": "open"},
+            ],
+            "layout": {
+                "Nodes": {
+                    "Nova-gyd": {"DependsOn": []},
+                    "Nova-gyd.1": {"DependsOn": []},
+                    "Nova-gyd.2": {"DependsOn": []},
+                    "Nova-gyd.3": {"DependsOn": ["Nova-gyd.1", "Nova-gyd.2", "Nova-gyd.1"]},
+                }
+            }
+        }
+        mock_subprocess_run.side_effect = [
+            bd_result(graph_data),
+            bd_result([{"id": "Nova-gyd.1"}, {"id": "Nova-gyd.2"}]),
+        ]
+        worker = Mock()
+        worker.get_token_usage.return_value = {}
+
+        orch = BeadOrchestrator("Nova-gyd")
+        ready = orch._seed_ready_tasks()
+        assert ready == ["Nova-gyd.1", "Nova-gyd.2"]
+        ready.clear()
+
+        orch.complete_task("Nova-gyd.1", worker)
+        assert orch._ready == []
+        orch.complete_task("Nova-gyd.2", worker)
+        assert orch._ready == ["Nova-gyd.3"]
+        assert mock_subprocess_run.call_count == 2
+
+    def test_task_with_dependency_in_other_epic_waits_for_bd_ready(self, mock_subprocess_run):
+        """Test that a task blocked outside the epic isn't released on local counts."""
+        graph_data = {
+            "issues": [
+                {"id": "Nova-gyd", "title": "Test Epic", "status": "open"},
+                {"id": "Nova-gyd.1", "title": "Task 1", "status": "open"},
+                {"id": "Nova-gyd.2", "title": "Task 2", "status": "open"},
+                {"id": "Nova-gyd.3", "title": "Task 3", "status": "open"},
+            ],
+            "layout": {
+                "Nodes": {
+                    "Nova-gyd": {"DependsOn": []},
+                    "Nova-gyd.1": {"DependsOn": []},
+                    # Also blocked by a bead from another epic
+                    "Nova-gyd.2": {"DependsOn": ["Nova-gyd.1", "Nova-xyz.1"]},
+                    "Nova-gyd.3": {"DependsOn": ["Nova-gyd.1"]},
+                }
+            }
+        }
+        mock_subprocess_run.side_effect = [
+            bd_result(graph_data),
+            bd_result([{"id": "Nova-gyd.1"}]),
+            # Nova-xyz.1 is still open, so bd ready holds Nova-gyd.2 back
+            bd_result([{"id": "Nova-gyd.3"}]),
+            # ...until it closes
+            bd_result([{"id": "Nova-gyd.2"}]),
+        ]
+        worker = Mock()
+        worker.get_token_usage.return_value = {}
+
+        orch = BeadOrchestrator("Nova-gyd")
+        orch._seed_ready_tasks().clear()
+
+        orch.complete_task("Nova-gyd.1", worker)
+        # Only the task blocked by nothing but Nova-gyd.1 is released locally
+        assert orch._ready == ["Nova-gyd.3"]
+        assert orch._unverified == ["Nova-gyd.2"]
+
+        orch._verify_released()
+        assert orch._ready == ["Nova-gyd.3"]
+        assert orch._unverified == ["Nova-gyd.2"]
+
+        orch._verify_released()
+        assert orch._ready == ["Nova-gyd.3", "Nova-gyd.2"]
+        assert orch._unverified == []
+        assert mock_subprocess_run.call_count == 4
+
+    @patch("program_nova.engine.bead_orchestrator.Worker")
+    @patch("program_nova.engine.bead_orchestrator.time")
+    def test_start_confirms_task_released_by_last_worker(
+        self, mock_time, mock_worker_class, mock_subprocess_run
+    ):
+        """Test that start() checks bd ready before exiting with unverified tasks."""
+        mock_time.time.return_value = 1000.0
+        graph_data = {
+            "issues": [
+                {"id": "Nova-gyd", "title": "Test Epic", "status": "open"},
+                {"id": "Nova-gyd.1", "title": "Task 1", "status": "open"},
+                {"id": "Nova-gyd.2", "title": "Task 2", "status": "open"},
+            ],
+            "layout": {
+                "Nodes": {
+                    "Nova-gyd": {"DependsOn": []},
+                    "Nova-gyd.1": {"DependsOn": []},
+                    "Nova-gyd.2": {"DependsOn": ["Nova-gyd.1", "Nova-xyz.1"]},
+                }
+            }
+        }
+        mock_subprocess_run.side_effect = [
+            bd_result(graph_data),
+            bd_result([{"id": "Nova-gyd.1"}]),
+            # Nova-xyz.1 has already closed
+            bd_result([{"id": "Nova-gyd.2"}]),
+        ]
+
+        workers = []
+        for _ in range(2):
+            worker = Mock()
+            worker.is_alive.return_value = False
+            worker.wait.return_value = 0
+            worker.get_token_usage.return_value = {}
+            workers.append(worker)
+        mock_worker_class.side_effect = workers
+
+        orch = BeadOrchestrator("Nova-gyd")
+        # An unchanged store must not suppress the final check
+        orch._store_key = lambda: ("unchanged",)
+        orch._verified_key = ("unchanged",)
+        orch.start(check_interval=0.1, max_iterations=5)
+
+        # Nova-gyd.1 was the last running worker when it released Nova-gyd.2
+        started = [c.kwargs["task_id"] for c in mock_worker_class.call_args_list]
+        assert started == ["Nova-gyd.1", "Nova-gyd.2"]
+        assert orch._unverified == []
+        assert mock_subprocess_run.call_count == 3
+
     @patch("program_nova.engine.bead_orchestrator.Worker")
     @patch("program_nova.engine.bead_orchestrator.time")
     def test_stop_flag_initialized(self, mock_time, mock_worker_class, mock_subprocess_run):
@@ -526,6 +846,12 @@ class TestBeadOrchestrator:
         orch.stop()
         assert orch.stop_flag.is_set()
 
+    def test_stop_wakes_waiting_loop(self, mock_subprocess_run):
+        """Test that stop() wakes the main loop instead of waiting out the interval."""
+        orch = BeadOrchestrator("Nova-gyd")
+        orch.stop()
+        assert orch._wakeup.is_set()
+
     @patch("program_nova.engine.bead_orchestrator.Worker")
     @patch("program_nova.engine.bead_orchestrator.time")
     def test_start_exits_on_stop_flag(self, mock_time, mock_worker_class, mock_subprocess_run):
@@ -536,7 +862,7 @@ class TestBeadOrchestrator:
 
         # Mock get_ready_tasks to return tasks
         ready_tasks_response = [{"id": "Nova-gyd.1"}]
-        mock_subprocess_run.return_value = Mock(stdout=json.dumps(ready_tasks_response))
+        mock_subprocess_run.return_value = bd_result(ready_tasks_response)
 
         orch = BeadOrchestrator("Nova-gyd")
 
@@ -558,30 +884,37 @@ class TestBeadOrchestrator:
         # Mock time
         mock_time.time.return_value = 1000.0
 
-        # Track sleep calls to trigger stop after first iteration
-        sleep_count = [0]
-        def mock_sleep(duration):
-            sleep_count[0] += 1
-            # Stop after first sleep (first iteration complete)
-            if sleep_count[0] == 1:
+        # Track waits to trigger stop after first iteration
+        wait_count = [0]
+        def mock_wait(timeout=None):
+            wait_count[0] += 1
+            # Stop after first wait (first iteration complete)
+            if wait_count[0] == 1:
                 orch.stop()
-        mock_time.sleep = mock_sleep
+            return True
 
         # Mock get_ready_tasks to keep returning tasks
         ready_tasks_response = [{"id": "Nova-gyd.1"}]
 
-        # Mock bd show response
-        bead_response = [{"id": "Nova-gyd.1", "title": "Task 1", "description": "First", "status": "open"}]
+        # Mock bd graph response
+        graph_data = {
+            "issues": [
+                {"id": "Nova-gyd", "title": "Test Epic", "status": "open"},
+                {"id": "Nova-gyd.1", "title": "Task 1", "description": "First", "status": "open"},
+            ],
+            "layout": {
+                "Nodes": {
+                    "Nova-gyd": {"DependsOn": []},
+                    "Nova-gyd.1": {"DependsOn": []},
+                }
+            }
+        }
 
         mock_subprocess_run.side_effect = [
-            # First iteration: get_ready_tasks
-            Mock(stdout=json.dumps(ready_tasks_response)),
-            # bd update
-            Mock(returncode=0),
-            # bd show
-            Mock(stdout=json.dumps(bead_response)),
-            # Second iteration: get_ready_tasks (but we stop during sleep)
-            Mock(stdout=json.dumps(ready_tasks_response)),
+            # First iteration: bd graph
+            bd_result(graph_data),
+            # get_ready_tasks
+            bd_result(ready_tasks_response),
         ]
 
         # Mock worker that stays alive
@@ -590,9 +923,12 @@ class TestBeadOrchestrator:
         mock_worker_class.return_value = mock_worker
 
         orch = BeadOrchestrator("Nova-gyd")
-        orch.start(check_interval=0.1, max_iterations=10)
+        with patch.object(orch._wakeup, "wait", side_effect=mock_wait):
+            orch.start(check_interval=0.1, max_iterations=10)
 
         # Should have created exactly 1 worker before stopping
         assert mock_worker_class.call_count == 1
-        # Sleep should have been called once
-        assert sleep_count[0] == 1
+        # Wait should have been called once
+        assert wait_count[0] == 1
+        # Worker exit should be wired to the wakeup event
+        mock_worker.notify_on_exit.assert_called_once_with(orch._wakeup)
@@ -10,6 +10,7 @@ from pathlib import Path
 from unittest.mock import patch, Mock
 import pytest
 
+from program_nova.engine import orchestrator
 from program_nova.engine.orchestrator import setup_logging
 
 
@@ -31,6 +32,9 @@ class TestSetupLogging:
         # Check log level
         assert logger.level == logging.INFO
 
+        # Console logging doesn't touch the filesystem
+        assert not (tmp_path / "logs").exists()
+
     def test_setup_logging_daemon_mode(self, tmp_path, monkeypatch):
         """Test logging setup in daemon mode."""
         # Change to temp directory
@@ -38,10 +42,18 @@ class TestSetupLogging:
 
         logger = setup_logging(daemon_mode=True)
 
-        # Should have one handler (RotatingFileHandler)
+        # Should have one handler (QueueHandler feeding a RotatingFileHandler)
         assert len(logger.handlers) == 1
         handler = logger.handlers[0]
-        assert isinstance(handler, logging.handlers.RotatingFileHandler)
+        assert isinstance(handler, logging.handlers.QueueHandler)
+        listener = orchestrator._log_listener
+        assert listener is not None and listener._thread is not None
+        assert isinstance(listener.handlers[0], logging.handlers.RotatingFileHandler)
+
+        # Records reach the file once the listener is stopped (flushed)
+        logging.getLogger("test").info("hello from daemon mode")
+        orchestrator.stop_logging()
+        assert "hello from daemon mode" in (tmp_path / "logs" / "orchestrator.log").read_text()
 
         # Check that logs directory was created
         logs_dir = tmp_path / "logs"
@@ -63,6 +75,7 @@ class TestSetupLogging:
         assert not logs_dir.exists()
 
         setup_logging(daemon_mode=True)
+        orchestrator.stop_logging()
 
         assert logs_dir.exists()
 
@@ -87,44 +100,35 @@ class TestSetupLogging:
         assert isinstance(logger.handlers[0], logging.StreamHandler)
 
 
+@pytest.fixture(scope="module")
+def help_result():
+    """Run the orchestrator's --help once for all the flag checks."""
+    return subprocess.run(
+        [sys.executable, "-m", "program_nova.engine.orchestrator", "--help"],
+        capture_output=True,
+        text=True,
+    )
+
+
 class TestOrchestratorDaemonMode:
     """Tests for orchestrator daemon mode execution."""
 
-    def test_orchestrator_accepts_daemon_flag(self):
+    def test_orchestrator_accepts_daemon_flag(self, help_result):
         """Test that orchestrator accepts --daemon flag."""
         # This is a smoke test - we just verify the argument is accepted
         # We don't actually run the orchestrator since we don't have a CASCADE.md
+        assert help_result.returncode == 0
+        assert "--daemon" in help_result.stdout
 
-        result = subprocess.run(
-            [sys.executable, "-m", "program_nova.engine.orchestrator", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "--daemon" in result.stdout
-
-    def test_orchestrator_accepts_max_workers_flag(self):
+    def test_orchestrator_accepts_max_workers_flag(self, help_result):
         """Test that orchestrator accepts --max-workers flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "program_nova.engine.orchestrator", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "--max-workers" in result.stdout
+        assert help_result.returncode == 0
+        assert "--max-workers" in help_result.stdout
 
-    def test_orchestrator_accepts_state_file_flag(self):
+    def test_orchestrator_accepts_state_file_flag(self, help_result):
         """Test that orchestrator accepts --state-file flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "program_nova.engine.orchestrator", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "--state-file" in result.stdout
+        assert help_result.returncode == 0
+        assert "--state-file" in help_result.stdout
 
 
 if __name__ == "__main__":
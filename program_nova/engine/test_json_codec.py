@@ -0,0 +1,36 @@
+"""Tests for the JSON codec helpers."""
+
+from unittest.mock import patch
+
+from program_nova.engine import json_codec
+
+
+def test_round_trip():
+    """Test that dumps/loads round-trip nested data."""
+    data = {"type": "metrics", "token_usage": {"input_tokens": 10}, "cost_usd": 0.5}
+    encoded = json_codec.dumps(data)
+    assert isinstance(encoded, str)
+    assert json_codec.loads(encoded) == data
+
+
+def test_loads_accepts_bytes():
+    """Test that loads decodes raw subprocess output."""
+    assert json_codec.loads(b'[{"id": "Nova-1"}]') == [{"id": "Nova-1"}]
+
+
+def test_stdlib_fallback_matches():
+    """Test that the stdlib fallback produces the same compact encoding."""
+    data = {"a": [1, 2], "b": "x"}
+    expected = json_codec.dumps(data)
+    with patch.object(json_codec, "ORJSON_AVAILABLE", False):
+        assert json_codec.dumps(data) == expected
+        assert json_codec.loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_dumps_bytes_indented_matches_stdlib():
+    """Test that indented output is the same with and without orjson."""
+    data = {"project": {"name": "P", "started_at": None}, "tasks": {"F1": {"status": "pending"}}}
+    encoded = json_codec.dumps_bytes(data, indent=True)
+    assert isinstance(encoded, bytes)
+    with patch.object(json_codec, "ORJSON_AVAILABLE", False):
+        assert json_codec.dumps_bytes(data, indent=True) == encoded
@@ -7,20 +7,36 @@ worker spawning, concurrency limits, and task lifecycle management.
 
 import json
 import pytest
+import runpy
+import sys
 import time
+import warnings
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 
 from program_nova.engine.orchestrator import Orchestrator
-from program_nova.engine.state import StateManager, TaskStatus
+from program_nova.engine.state import TaskStatus
 from program_nova.engine.worker import Worker, WorkerStatus
 from program_nova.engine.parser import parse_cascade
 
 
-@pytest.fixture
-def temp_cascade_file(tmp_path):
-    """Create a temporary CASCADE.md file for testing."""
+@pytest.fixture(scope="module", autouse=True)
+def cascade_cache_home(tmp_path_factory):
+    """Keep the orchestrator's parse cache out of the user's cache directory."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
+@pytest.fixture(scope="module")
+def temp_cascade_file(tmp_path_factory):
+    """Create a CASCADE.md file shared by the module's tests.
+
+    Tests only read it, so after the first Orchestrator parses it the rest
+    load the parse from the module's cache directory; each load rebuilds
+    the DAG, so tests don't share progress.
+    """
     cascade_content = """# Test Project
 
 ## L1: Application
@@ -40,7 +56,7 @@ def temp_cascade_file(tmp_path):
 | D1 | Docker | Create Dockerfile | - |
 | D2 | CI | Setup CI | D1 |
 """
-    cascade_file = tmp_path / "CASCADE.md"
+    cascade_file = tmp_path_factory.mktemp("cascade") / "CASCADE.md"
     cascade_file.write_text(cascade_content)
     return str(cascade_file)
 
@@ -105,9 +121,9 @@ class TestReadyTaskResolution:
         assert "D1" in ready
         assert len(ready) == 2
 
-    def test_get_ready_tasks_after_completion(self, orchestrator, temp_state_file):
+    def test_get_ready_tasks_after_completion(self, orchestrator):
         """Test that completing a task makes dependent tasks ready."""
-        state_mgr = StateManager(temp_state_file)
+        state_mgr = orchestrator.state_mgr
 
         # Mark F1 as completed
         state_mgr.update_task("F1", status=TaskStatus.COMPLETED)
@@ -124,9 +140,9 @@ class TestReadyTaskResolution:
         assert "D1" in ready  # Still ready
         assert "F1" not in ready  # Already completed
 
-    def test_get_ready_tasks_respects_failed_deps(self, orchestrator, temp_state_file):
+    def test_get_ready_tasks_respects_failed_deps(self, orchestrator):
         """Test that tasks with failed dependencies are not ready."""
-        state_mgr = StateManager(temp_state_file)
+        state_mgr = orchestrator.state_mgr
 
         # Mark F1 as failed
         state_mgr.fail_task("F1", error="Test failure")
@@ -162,6 +178,10 @@ class TestWorkerManagement:
         assert "F1" in orchestrator.active_workers
         assert orchestrator.active_workers["F1"] == mock_worker
 
+        # Worker exit and token usage reports should wake the main loop
+        mock_worker.notify_on_exit.assert_called_once_with(orchestrator._wakeup)
+        mock_worker.notify_on_progress.assert_called_once_with(orchestrator._wakeup)
+
     @patch('program_nova.engine.orchestrator.Worker')
     def test_start_worker_uses_claude_code_command(self, mock_worker_class, orchestrator):
         """Test that start_worker uses the Claude Code command to spawn workers."""
@@ -261,6 +281,32 @@ class TestWorkerManagement:
             assert tokens["output_tokens"] == 500
 
 
+    def test_monitor_workers_skips_unchanged_tokens(self, orchestrator):
+        """Test that token usage is only written to state when it changes."""
+        mock_worker = Mock()
+        mock_worker.is_alive.return_value = True
+        mock_worker.get_token_usage.return_value = {
+            "input_tokens": 1000,
+            "output_tokens": 500,
+            "cache_read_tokens": 0,
+            "cache_creation_tokens": 0,
+        }
+        orchestrator.active_workers["F1"] = mock_worker
+
+        with patch.object(orchestrator.state_mgr, "update_task_tokens") as mock_update:
+            orchestrator.monitor_workers()
+            orchestrator.monitor_workers()
+            assert mock_update.call_count == 1
+
+            mock_worker.get_token_usage.return_value = {
+                "input_tokens": 2000,
+                "output_tokens": 500,
+                "cache_read_tokens": 0,
+                "cache_creation_tokens": 0,
+            }
+            orchestrator.monitor_workers()
+            assert mock_update.call_count == 2
+
 class TestTaskCompletion:
     """Test handling of task completion and failure."""
 
@@ -292,6 +338,32 @@ class TestTaskCompletion:
         if "F1" in state["tasks"]:
             assert state["tasks"]["F1"]["status"] == TaskStatus.COMPLETED.value
 
+    @patch('program_nova.engine.orchestrator.Worker')
+    def test_completion_uses_in_memory_start_time(self, mock_worker_class, orchestrator):
+        """Test that completing a worker we started doesn't re-read state."""
+        mock_worker = Mock()
+        mock_worker.pid = 12345
+        mock_worker.is_alive.return_value = False
+        mock_worker.get_exit_code.return_value = 0
+        mock_worker.get_token_usage.return_value = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_read_tokens": 0,
+            "cache_creation_tokens": 0,
+        }
+        mock_worker_class.return_value = mock_worker
+
+        orchestrator.start_worker("F1")
+
+        with patch.object(orchestrator.state_mgr, "read_state") as mock_read:
+            orchestrator.monitor_workers()
+            mock_read.assert_not_called()
+
+        state = orchestrator.state_mgr.read_state()
+        assert state["tasks"]["F1"]["status"] == TaskStatus.COMPLETED.value
+        assert state["tasks"]["F1"]["duration_seconds"] == 0
+        assert "F1" not in orchestrator._start_times
+
     def test_handle_failed_worker(self, orchestrator):
         """Test handling a worker that fails."""
         # Create a mock failed worker
@@ -321,14 +393,30 @@ class TestTaskCompletion:
             assert state["tasks"]["F1"]["status"] == TaskStatus.FAILED.value
 
 
+    def test_get_status_summary_counts_statuses(self, orchestrator):
+        """Test that the status summary counts each status once."""
+        state_mgr = orchestrator.state_mgr
+        state_mgr.complete_task("F1", completed_at=datetime.now().isoformat(), duration_seconds=1)
+        state_mgr.fail_task("F2", error="boom")
+        state_mgr.update_task("F3", status=TaskStatus.IN_PROGRESS)
+
+        summary = orchestrator.get_status_summary()
+
+        assert summary["completed"] == 1
+        assert summary["failed"] == 1
+        assert summary["in_progress"] == 1
+        assert summary["pending"] == summary["total_tasks"] - 3
+        assert summary["active_workers"] == 0
+
 class TestMainLoop:
     """Test the main execution loop."""
 
     @patch('program_nova.engine.orchestrator.Worker')
-    def test_run_completes_all_tasks(self, mock_worker_class, orchestrator, temp_state_file):
+    def test_run_completes_all_tasks(self, mock_worker_class, orchestrator):
         """Test that run() executes all tasks and completes."""
         # Mock all workers to complete immediately
         completed_tasks = []
+        state_mgr = orchestrator.state_mgr
 
         def create_completing_worker(task_id, desc):
             w = Mock()
@@ -346,7 +434,6 @@ class TestMainLoop:
 
             # Mark task as completed when worker starts
             def start_side_effect(cmd, cwd=None):
-                state_mgr = StateManager(temp_state_file)
                 state_mgr.complete_task(
                     task_id,
                     completed_at=datetime.now().isoformat(),
@@ -381,7 +468,14 @@ class TestMainLoop:
             )
 
         # Run should exit immediately
-        orchestrator.run(check_interval=0.1, max_iterations=10)
+        with patch.object(
+            orchestrator, "get_ready_tasks", wraps=orchestrator.get_ready_tasks
+        ) as mock_ready:
+            orchestrator.run(check_interval=0.1, max_iterations=10)
+
+        # Ready tasks are computed once for the single tick, not again
+        # for the completion check
+        assert mock_ready.call_count == 1
 
         # Verify no workers are active
         assert len(orchestrator.active_workers) == 0
@@ -431,43 +525,44 @@ class TestConcurrency:
         assert len(orchestrator.active_workers) <= orchestrator.max_workers
 
 
-class TestDirectExecution:
-    """Test that orchestrator.py can be executed as a module."""
+    @patch('program_nova.engine.orchestrator.Worker')
+    def test_run_backs_off_poll_interval_while_idle(self, mock_worker_class, orchestrator):
+        """Test that the loop wait grows while idle and is capped at check_interval."""
+        def create_worker(*args, **kwargs):
+            w = Mock()
+            w.pid = 12345
+            w.is_alive.return_value = True
+            w.get_token_usage.return_value = {
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cache_read_tokens": 0,
+                "cache_creation_tokens": 0,
+            }
+            return w
 
-    def test_orchestrator_module_execution(self, tmp_path):
-        """Test that orchestrator.py can be run as a module without import errors."""
-        import subprocess
-        import sys
+        mock_worker_class.side_effect = create_worker
+        orchestrator._wakeup = Mock()
 
-        # Create a minimal CASCADE.md for testing
-        cascade_content = """# Test Project
+        orchestrator.run(check_interval=0.1, max_iterations=4)
 
-## L1: Application
+        waits = [c.args[0] for c in orchestrator._wakeup.wait.call_args_list]
+        # Workers start on the first tick, then nothing changes
+        assert waits == pytest.approx([0.05, 0.075, 0.1, 0.1])
 
-### L2: Foundation
-| Task ID | Task Name | What Changes | Depends On |
-|---------|-----------|--------------|------------|
-| F1 | Core Types | Define base types | - |
-"""
-        cascade_file = tmp_path / "CASCADE.md"
-        cascade_file.write_text(cascade_content)
-
-        # Get the project root directory (parent of program_nova)
-        project_root = Path(__file__).parent.parent.parent
-
-        # Run orchestrator.py as a module with --help to verify imports work
-        result = subprocess.run(
-            [sys.executable, "-m", "program_nova.engine.orchestrator", "--help"],
-            cwd=str(project_root),
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+class TestDirectExecution:
+    """Test that orchestrator.py can be executed as a module."""
+
+    def test_orchestrator_module_execution(self, capsys):
+        """Test that orchestrator.py can be run as a module without import errors."""
+        # Run the module as __main__ in-process with --help; a broken
+        # (e.g. relative) import raises here instead of printing usage
+        with patch.object(sys, "argv", ["orchestrator", "--help"]), \
+                warnings.catch_warnings(), \
+                pytest.raises(SystemExit) as exc:
+            # runpy warns that the module is already imported; that's expected
+            warnings.simplefilter("ignore", RuntimeWarning)
+            runpy.run_module("program_nova.engine.orchestrator", run_name="__main__")
 
-        # Should not have import errors
-        assert "ImportError" not in result.stderr, f"ImportError found: {result.stderr}"
-        assert "ModuleNotFoundError" not in result.stderr, f"ModuleNotFoundError found: {result.stderr}"
-        assert "attempted relative import" not in result.stderr, f"Relative import error found: {result.stderr}"
         # Should show help text and exit successfully
-        assert result.returncode == 0, f"Non-zero exit code: {result.returncode}, stderr: {result.stderr}"
-        assert "usage:" in result.stdout.lower(), f"Usage text not found in: {result.stdout}"
+        assert exc.value.code == 0
+        assert "usage:" in capsys.readouterr().out.lower()
@@ -1,15 +1,18 @@
 """Tests for CASCADE.md parser."""
+import os
+import tempfile
 import unittest
 from pathlib import Path
-import tempfile
-from program_nova.engine.parser import CascadeParser
+from unittest import mock
+
+from program_nova.engine.parser import DAG, CascadeParser, parse_cascade_cached
 
 
 class TestCascadeParser(unittest.TestCase):
     """Test cases for CascadeParser."""
 
     def setUp(self):
-        """Create a temporary CASCADE.md file for testing."""
+        """Create a parser over an in-memory CASCADE.md for testing."""
         self.test_cascade = """# Test Project
 
 ## L1: Application
@@ -35,14 +38,7 @@ class TestCascadeParser(unittest.TestCase):
 | D1 | Docker Setup | Create Docker files | - |
 | D2 | CI Pipeline | Setup CI | D1, F2 |
 """
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md')
-        self.temp_file.write(self.test_cascade)
-        self.temp_file.close()
-        self.parser = CascadeParser(self.temp_file.name)
-
-    def tearDown(self):
-        """Clean up temporary file."""
-        Path(self.temp_file.name).unlink()
+        self.parser = CascadeParser(text=self.test_cascade)
 
     def test_parse_project_name(self):
         """Test that project name is correctly extracted."""
@@ -118,6 +114,57 @@ class TestCascadeParser(unittest.TestCase):
         ready = dag.get_ready_tasks(completed)
         self.assertIn('P2', ready)
 
+    def test_incremental_ready_set(self):
+        """Test that mark_completed keeps the ready set in line with get_ready_tasks."""
+        dag = self.parser.parse()['dag']
+
+        self.assertEqual(dag.ready_tasks(), dag.get_ready_tasks({}))
+
+        newly_ready = dag.mark_completed('F1')
+        self.assertSetEqual(set(newly_ready), {'F2', 'F3', 'P1'})
+        self.assertEqual(
+            dag.ready_tasks(),
+            dag.get_ready_tasks({'F1': 'completed'})
+        )
+
+        dag.mark_completed('F3')
+        dag.mark_completed('P1')
+        self.assertIn('P2', dag.ready_tasks())
+        self.assertNotIn('F1', dag.ready_tasks())
+
+    def test_sync_completed_rebuilds_on_regression(self):
+        """Test that sync_completed recovers when a completed task is reset."""
+        dag = self.parser.parse()['dag']
+
+        dag.sync_completed({'F1', 'D1'})
+        self.assertIn('F2', dag.ready_tasks())
+
+        # F1 no longer completed (e.g. state was reset)
+        dag.sync_completed({'D1'})
+        self.assertNotIn('F2', dag.ready_tasks())
+        self.assertIn('F1', dag.ready_tasks())
+
+    def test_task_depth(self):
+        """Test that task depths are precomputed from the dependency tree."""
+        dag = self.parser.parse()['dag']
+
+        self.assertEqual(dag.get_task_depth('F1'), 0)
+        self.assertEqual(dag.get_task_depth('F2'), 1)
+        self.assertEqual(dag.get_task_depth('P2'), 2)
+
+    def test_deep_chain_has_no_recursion_limit(self):
+        """Test that cycle detection and depth handle chains deeper than the recursion limit."""
+        tasks = {'T0': {'depends_on': []}}
+        for i in range(1, 5000):
+            tasks[f'T{i}'] = {'depends_on': [f'T{i - 1}']}
+
+        dag = DAG(tasks)
+        self.assertEqual(dag.get_task_depth('T4999'), 4999)
+
+        tasks['T0']['depends_on'] = ['T4999']
+        with self.assertRaises(ValueError):
+            DAG(tasks)
+
     def test_cyclic_dependency_detection(self):
         """Test that parser detects cyclic dependencies."""
         cyclic_cascade = """# Test Project
@@ -130,16 +177,11 @@ class TestCascadeParser(unittest.TestCase):
 | F1 | Task 1 | Description | F2 |
 | F2 | Task 2 | Description | F1 |
 """
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md')
-        temp_file.write(cyclic_cascade)
-        temp_file.close()
-
-        parser = CascadeParser(temp_file.name)
+        parser = CascadeParser(text=cyclic_cascade)
         with self.assertRaises(ValueError) as context:
             parser.parse()
 
         self.assertIn('cyclic', str(context.exception).lower())
-        Path(temp_file.name).unlink()
 
     def test_empty_depends_on(self):
         """Test that tasks with '-' or empty Depends On are handled correctly."""
@@ -153,5 +195,68 @@ class TestCascadeParser(unittest.TestCase):
         self.assertEqual(tasks['D1']['depends_on'], [])
 
 
+    def test_requires_file_or_text(self):
+        """Test that the parser takes exactly one of a path or text."""
+        with self.assertRaises(ValueError):
+            CascadeParser()
+        with self.assertRaises(ValueError):
+            CascadeParser('CASCADE.md', text=self.test_cascade)
+        with self.assertRaises(FileNotFoundError):
+            CascadeParser('/nonexistent/CASCADE.md')
+
+    def test_parse_cascade_cached(self):
+        """Test that the cache is reused until the file changes."""
+        project_dir = tempfile.TemporaryDirectory()
+        cache_home = tempfile.TemporaryDirectory()
+        self.addCleanup(project_dir.cleanup)
+        self.addCleanup(cache_home.cleanup)
+        cascade_file = os.path.join(project_dir.name, 'CASCADE.md')
+        with open(cascade_file, 'w') as f:
+            f.write(self.test_cascade)
+
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': cache_home.name}):
+            first = parse_cascade_cached(cascade_file)
+            self.assertEqual(first['tasks'], self.parser.parse()['tasks'])
+
+            # The cache lives in the private cache directory, not the project
+            self.assertEqual(os.listdir(project_dir.name), ['CASCADE.md'])
+            cache_files = list(Path(cache_home.name).rglob('*.json'))
+            self.assertEqual(len(cache_files), 1)
+
+            # Unchanged file: served from the cache without parsing
+            with mock.patch.object(CascadeParser, 'parse') as mock_parse:
+                cached = parse_cascade_cached(cascade_file)
+            mock_parse.assert_not_called()
+            self.assertEqual(cached['tasks'], first['tasks'])
+            self.assertEqual(cached['hierarchy'], first['hierarchy'])
+            self.assertEqual(cached['dag'].ready_tasks(), first['dag'].ready_tasks())
+
+            # Edited file: cache is invalidated
+            with open(cascade_file, 'a') as f:
+                f.write('| D3 | Deploy | Ship it | D2 |\n')
+            os.utime(cascade_file, ns=(0, os.stat(cascade_file).st_mtime_ns + 1))
+            updated = parse_cascade_cached(cascade_file)
+            self.assertIn('D3', updated['tasks'])
+
+    def test_parse_cascade_cached_ignores_mismatched_cache(self):
+        """Test that a cache file whose key doesn't match is never decoded."""
+        project_dir = tempfile.TemporaryDirectory()
+        cache_home = tempfile.TemporaryDirectory()
+        self.addCleanup(project_dir.cleanup)
+        self.addCleanup(cache_home.cleanup)
+        cascade_file = os.path.join(project_dir.name, 'CASCADE.md')
+        with open(cascade_file, 'w') as f:
+            f.write(self.test_cascade)
+
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': cache_home.name}):
+            parse_cascade_cached(cascade_file)
+            cache_file, = Path(cache_home.name).rglob('*.json')
+            cache_file.write_bytes(b'["foreign"]\n{"tasks": {"X1": {}}}')
+
+            with mock.patch('program_nova.engine.parser.json.loads') as mock_loads:
+                result = parse_cascade_cached(cascade_file)
+            mock_loads.assert_not_called()
+            self.assertNotIn('X1', result['tasks'])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,7 @@
 """Tests for state.py - cascade state management with file locking."""
 
+import asyncio
+import fcntl
 import json
 import os
 import tempfile
@@ -7,6 +9,7 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Thread
+from unittest.mock import patch
 
 import pytest
 
@@ -23,8 +26,9 @@ class TestStateManager:
             state_path = f.name
         yield state_path
         # Cleanup
-        if os.path.exists(state_path):
-            os.unlink(state_path)
+        for path in (state_path, str(Path(state_path).with_suffix(".lock"))):
+            if os.path.exists(path):
+                os.unlink(path)
 
     @pytest.fixture
     def state_manager(self, temp_state_file):
@@ -144,6 +148,22 @@ class TestStateManager:
         assert state["tasks"]["F1"]["status"] == "failed"
         assert state["tasks"]["F1"]["error"] == "Test failed: assertion error"
 
+    def test_fail_task_timestamp_taken_at_call_time(self, temp_state_file):
+        """Test that fail_task stamps completed_at when called, not when the update is written."""
+        state_manager = StateManager(temp_state_file)
+        state_manager.initialize("Test", "/cascade.md")
+
+        with state_manager.batch():
+            before = datetime.now(timezone.utc)
+            state_manager.fail_task(task_id="F1", error="boom")
+            after = datetime.now(timezone.utc)
+            time.sleep(0.01)
+
+        completed_at = datetime.fromisoformat(
+            StateManager(temp_state_file).read_state()["tasks"]["F1"]["completed_at"]
+        )
+        assert before <= completed_at <= after
+
     def test_concurrent_writes_use_file_locking(self, state_manager):
         """Test that concurrent writes don't corrupt the state file."""
         state_manager.initialize("Test", "/cascade.md")
@@ -239,3 +259,232 @@ class TestStateManager:
         state = state_manager.read_state()
         assert state["tasks"]["F1"]["token_usage"]["input_tokens"] == 200
         assert state["tasks"]["F1"]["token_usage"]["output_tokens"] == 100
+
+    def test_batched_updates_written_on_end_batch(self, state_manager):
+        """Test that updates inside a batch are held until end_batch."""
+        state_manager.initialize("Test", "/cascade.md")
+
+        state_manager.begin_batch()
+        state_manager.update_task(task_id="F1", status=TaskStatus.IN_PROGRESS)
+        state_manager.update_task_tokens(task_id="F1", input_tokens=100, output_tokens=50)
+
+        # Nothing written yet
+        assert "F1" not in state_manager.read_state()["tasks"]
+
+        state_manager.end_batch()
+
+        state = state_manager.read_state()
+        assert state["tasks"]["F1"]["status"] == "in_progress"
+        assert state["tasks"]["F1"]["token_usage"]["input_tokens"] == 100
+
+        # Updates after the batch are written immediately again
+        state_manager.update_task(task_id="F2", status=TaskStatus.IN_PROGRESS)
+        assert "F2" in state_manager.read_state()["tasks"]
+
+    def test_batch_context_manager(self, state_manager):
+        """Test that batch() writes queued updates on exit, once for nested blocks."""
+        state_manager.initialize("Test", "/cascade.md")
+
+        with patch.object(state_manager, "apply_batch", wraps=state_manager.apply_batch) as spy:
+            with pytest.raises(RuntimeError):
+                with state_manager.batch():
+                    state_manager.update_task(task_id="F1", status=TaskStatus.IN_PROGRESS)
+                    with state_manager.batch():
+                        state_manager.update_task(task_id="F2", status=TaskStatus.IN_PROGRESS)
+                    assert "F2" not in state_manager.read_state()["tasks"]
+                    raise RuntimeError("boom")
+
+        # Both updates were written together despite the error
+        spy.assert_called_once()
+        assert {"F1", "F2"} <= set(state_manager.read_state()["tasks"])
+
+    def test_wal_appends_deltas_and_compacts(self, temp_state_file):
+        """Test that WAL mode appends deltas that readers replay, and compact folds them in."""
+        state_manager = StateManager(temp_state_file, wal=True)
+        state_manager.initialize("Test", "/cascade.md")
+        snapshot = Path(temp_state_file).read_bytes()
+
+        state_manager.update_task(task_id="F1", status=TaskStatus.IN_PROGRESS)
+        state_manager.update_task_tokens(task_id="F1", input_tokens=100, output_tokens=50)
+        state_manager.complete_task("F1", completed_at="2024-01-01T00:00:00", duration_seconds=5)
+
+        # Snapshot untouched; the deltas are in the log
+        assert Path(temp_state_file).read_bytes() == snapshot
+        assert len(state_manager.wal_path.read_bytes().splitlines()) == 3
+
+        # Any reader (WAL mode or not) sees the replayed state
+        state = StateManager(temp_state_file).read_state()
+        assert state["tasks"]["F1"]["status"] == "completed"
+        assert state["tasks"]["F1"]["token_usage"]["input_tokens"] == 100
+
+        state_manager.compact()
+        assert state_manager.wal_path.read_bytes() == b""
+        with open(temp_state_file) as f:
+            assert json.load(f) == state
+
+        state_manager.wal_path.unlink()
+
+    def test_wal_append_does_not_wait_for_readers(self, temp_state_file):
+        """Test that a WAL append proceeds while another process holds a shared lock."""
+        state_manager = StateManager(temp_state_file, wal=True)
+        state_manager.initialize("Test", "/cascade.md")
+
+        with open(state_manager.lock_path, "rb") as reader:
+            fcntl.flock(reader.fileno(), fcntl.LOCK_SH)
+            writer = Thread(
+                target=state_manager.update_task,
+                kwargs={"task_id": "F1", "status": TaskStatus.IN_PROGRESS},
+            )
+            writer.start()
+            writer.join(timeout=2.0)
+            assert not writer.is_alive()
+            fcntl.flock(reader.fileno(), fcntl.LOCK_UN)
+
+        assert state_manager.read_state()["tasks"]["F1"]["status"] == "in_progress"
+        state_manager.wal_path.unlink()
+
+    def test_non_wal_write_folds_in_existing_wal(self, temp_state_file):
+        """Test that a full rewrite includes pending WAL deltas and empties the log."""
+        wal_manager = StateManager(temp_state_file, wal=True)
+        wal_manager.initialize("Test", "/cascade.md")
+        wal_manager.update_task(task_id="F1", status=TaskStatus.IN_PROGRESS)
+
+        StateManager(temp_state_file).update_task(task_id="F2", status=TaskStatus.PENDING)
+
+        assert wal_manager.wal_path.read_bytes() == b""
+        with open(temp_state_file) as f:
+            state = json.load(f)
+        assert state["tasks"]["F1"]["status"] == "in_progress"
+        assert "F2" in state["tasks"]
+
+        wal_manager.wal_path.unlink()
+
+    def test_cached_reads_reuse_parse_until_file_changes(self, temp_state_file):
+        """Test that cache_reads skips re-parsing an unchanged, settled file."""
+        StateManager(temp_state_file).initialize("Test", "/cascade.md")
+        settled = time.time_ns() - 10**9
+        os.utime(temp_state_file, ns=(settled, settled))
+
+        reader = StateManager(temp_state_file, cache_reads=True)
+        first = reader.read_state()
+        assert reader.read_state() is first
+
+        # A write from another manager invalidates the cache
+        StateManager(temp_state_file).update_task(task_id="F1", status=TaskStatus.IN_PROGRESS)
+        assert "F1" in reader.read_state()["tasks"]
+
+    def test_cached_reads_skip_recently_modified_file(self, temp_state_file):
+        """Test that a just-written file is re-parsed on every read."""
+        StateManager(temp_state_file).initialize("Test", "/cascade.md")
+
+        reader = StateManager(temp_state_file, cache_reads=True)
+        assert reader.read_state() is not reader.read_state()
+
+    def test_corrupted_file_raises_json_decode_error(self, temp_state_file, state_manager):
+        """Test that a corrupted state file raises json.JSONDecodeError whichever codec is used."""
+        Path(temp_state_file).write_text('{"project": ')
+
+        with pytest.raises(json.JSONDecodeError):
+            state_manager.read_state()
+
+    def test_state_file_is_compact_and_export_pretty_indents(self, temp_state_file, state_manager):
+        """Test that writes are compact JSON and export_pretty writes an indented copy."""
+        state_manager.initialize("Test", "/cascade.md")
+        assert b"\n" not in Path(temp_state_file).read_bytes()
+
+        pretty_path = temp_state_file + ".pretty"
+        try:
+            state_manager.export_pretty(pretty_path)
+            with open(pretty_path) as f:
+                text = f.read()
+            assert text.startswith('{\n  "project"')
+            assert json.loads(text) == state_manager.read_state()
+        finally:
+            os.unlink(pretty_path)
+
+    def test_failed_write_leaves_previous_state_intact(self, temp_state_file, state_manager):
+        """Test that writes go through a temp file, so a failed write can't truncate the state."""
+        state_manager.initialize("Test", "/cascade.md")
+        state_manager.update_task(task_id="F1", status=TaskStatus.IN_PROGRESS)
+        before = Path(temp_state_file).read_bytes()
+
+        with patch("os.fsync", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                state_manager.update_task(task_id="F1", status=TaskStatus.COMPLETED)
+
+        assert Path(temp_state_file).read_bytes() == before
+        assert not os.path.exists(f"{temp_state_file}.tmp.{os.getpid()}")
+
+    def test_read_state_does_not_wait_for_writers(self, state_manager):
+        """Test that reads don't block while another process holds the write lock."""
+        state_manager.initialize("Test", "/cascade.md")
+
+        with open(state_manager.lock_path, "rb") as writer:
+            fcntl.flock(writer.fileno(), fcntl.LOCK_EX)
+            reader = Thread(target=state_manager.read_state)
+            reader.start()
+            reader.join(timeout=2.0)
+            assert not reader.is_alive()
+            fcntl.flock(writer.fileno(), fcntl.LOCK_UN)
+
+    def test_empty_tasks_do_not_share_nested_values(self, state_manager):
+        """Test that tasks created from the template get their own token_usage and files_changed."""
+        first = state_manager._get_empty_task()
+        second = state_manager._get_empty_task()
+        first["token_usage"]["input_tokens"] = 10
+        first["files_changed"].append("a.py")
+
+        assert second["token_usage"]["input_tokens"] == 0
+        assert second["files_changed"] == []
+        assert list(first) == list(StateManager._EMPTY_TASK_TEMPLATE)
+
+    def test_write_state_creates_parent_directory_once(self, tmp_path):
+        """Test that the state directory is created on the first write only."""
+        state_manager = StateManager(str(tmp_path / "nested" / "state.json"))
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            state_manager.initialize("Test", "/cascade.md")
+            state_manager.initialize("Test", "/cascade.md")
+
+        mock_mkdir.assert_called_once()
+        assert state_manager.read_state()["project"]["name"] == "Test"
+
+    def test_lock_file_opened_once(self, state_manager):
+        """Test that the lock file descriptor is reused across writes."""
+        state_manager.initialize("Test", "/cascade.md")
+        lock_fd = state_manager._lock_fd
+
+        with patch("os.open", wraps=os.open) as mock_open:
+            for i in range(5):
+                state_manager.update_task(task_id=f"F{i}", status=TaskStatus.PENDING)
+
+        assert state_manager._lock_fd == lock_fd
+        assert not any(
+            call.args[0] == state_manager.lock_path for call in mock_open.call_args_list
+        )
+        assert len(state_manager.read_state()["tasks"]) == 5
+
+    def test_read_state_async(self, state_manager):
+        """Test that the async read returns the same state as read_state."""
+        state_manager.initialize("Test", "/cascade.md")
+        state_manager.update_task(task_id="F1", status=TaskStatus.IN_PROGRESS)
+
+        state = asyncio.run(state_manager.read_state_async())
+        assert state == state_manager.read_state()
+
+    def test_consecutive_writes_skip_reparse(self, temp_state_file, state_manager):
+        """Test that a write reuses the state from this manager's previous write."""
+        state_manager.initialize("Test", "/cascade.md")
+        state_manager.update_task(task_id="F1", status=TaskStatus.IN_PROGRESS)
+
+        with patch.object(state_manager, "_load_locked", wraps=state_manager._load_locked) as mock_load:
+            state_manager.update_task_tokens(task_id="F1", input_tokens=100)
+            mock_load.assert_not_called()
+
+            # Another writer changes the file: the next write re-reads it
+            StateManager(temp_state_file).update_task(task_id="F2", status=TaskStatus.PENDING)
+            state_manager.update_task_tokens(task_id="F1", input_tokens=200)
+            mock_load.assert_called_once()
+
+        state = StateManager(temp_state_file).read_state()
+        assert state["tasks"]["F1"]["token_usage"]["input_tokens"] == 200
+        assert "F2" in state["tasks"]
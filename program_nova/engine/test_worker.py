@@ -6,7 +6,9 @@ Following TDD: Write tests first (Red), then implement (Green), then refactor (C
 
 import os
 import subprocess
+import sys
 import tempfile
+import threading
 import time
 import pytest
 from pathlib import Path
@@ -122,6 +124,43 @@ class TestWorkerMonitoring:
 
         assert worker.is_alive() is False
 
+    def test_worker_notify_on_exit_sets_event(self, tmp_path):
+        """Worker.notify_on_exit() should set the event once the process exits"""
+        worker = Worker(task_id="TEST-EXIT", task_description="Exit notification")
+        worker.log_path = tmp_path / "exit.log"
+        exited = threading.Event()
+
+        worker.start(command=["sleep", "0.1"])
+        worker.notify_on_exit(exited)
+
+        assert exited.wait(timeout=5.0) is True
+        assert worker.wait() == 0
+
+    def test_worker_is_alive_skips_waitpid_once_watched(self, monkeypatch, tmp_path):
+        """Worker.is_alive() should use the exit watcher instead of polling"""
+        worker = Worker(task_id="TEST-WATCH", task_description="Watched process")
+        worker.log_path = tmp_path / "watch.log"
+        exited = threading.Event()
+
+        worker.start(command=["sleep", "0.2"])
+        worker.notify_on_exit(exited)
+
+        waitpid_calls = []
+        real_waitpid = os.waitpid
+
+        def counting_waitpid(pid, options):
+            if options & os.WNOHANG:
+                waitpid_calls.append(pid)
+            return real_waitpid(pid, options)
+
+        monkeypatch.setattr(os, "waitpid", counting_waitpid)
+
+        assert worker.is_alive() is True
+        assert exited.wait(timeout=5.0) is True
+        assert worker.is_alive() is False
+        assert waitpid_calls == []
+        assert worker.wait() == 0
+
     def test_worker_get_exit_code_returns_none_while_running(self):
         """Worker.get_exit_code() should return None while process is running"""
         worker = Worker(task_id="TEST-008", task_description="Running process")
@@ -232,6 +271,34 @@ Token usage: input=200, output=75, cache_read=30, cache_creation=15"""
             assert tokens["cache_read_tokens"] == 0
             assert tokens["cache_creation_tokens"] == 0
 
+    def test_worker_reports_json_usage_while_running(self):
+        """Worker should expose and signal usage from JSON output before the process exits"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "streaming.log"
+            worker = Worker(task_id="TEST-015b", task_description="Streaming test")
+            worker.log_path = log_path
+
+            script = (
+                "import json, sys, time\n"
+                "print(json.dumps({'usage': {'input_tokens': 7, 'output_tokens': 3}}))\n"
+                "sys.stdout.flush()\n"
+                "time.sleep(5)\n"
+            )
+            progress = threading.Event()
+            worker.notify_on_progress(progress)
+            worker.start(command=[sys.executable, "-c", script])
+            try:
+                assert progress.wait(timeout=3.0) is True
+
+                assert worker.is_alive()
+                tokens = worker.get_token_usage()
+                assert tokens["input_tokens"] == 7
+                assert tokens["output_tokens"] == 3
+            finally:
+                worker.terminate()
+
+            assert '"input_tokens": 7' in log_path.read_text()
+
 
 class TestWorkerLifecycle:
     """Test complete worker lifecycle"""
@@ -260,6 +327,21 @@ class TestWorkerLifecycle:
             assert log_path.exists()
             assert "hello world" in log_path.read_text()
 
+    def test_wait_not_blocked_by_backgrounded_grandchild(self, monkeypatch):
+        """wait() should return soon after exit even if a grandchild holds stdout"""
+        monkeypatch.setattr("program_nova.engine.worker.DRAIN_TIMEOUT", 0.2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            worker = Worker(task_id="TEST-016b", task_description="Grandchild test")
+            worker.log_path = Path(tmpdir) / "grandchild.log"
+
+            worker.start(command=["sh", "-c", "sleep 5 & echo done"])
+            started = time.monotonic()
+            assert worker.wait() == 0
+
+            assert time.monotonic() - started < 2.0
+            assert worker.status == WorkerStatus.COMPLETED
+            assert "done" in worker.log_path.read_text()
+
     def test_worker_can_be_terminated(self):
         """Worker should support graceful termination"""
         worker = Worker(task_id="TEST-017", task_description="Termination test")
@@ -267,8 +349,8 @@ class TestWorkerLifecycle:
         worker.start(command=["sleep", "10"])
         assert worker.is_alive() is True
 
+        # terminate() waits for the process to exit, so no sleep is needed
         worker.terminate()
-        time.sleep(0.1)  # Give it a moment to terminate
 
         assert worker.is_alive() is False
         assert worker.status == WorkerStatus.FAILED
@@ -11,13 +11,28 @@ Responsibilities:
 
 import json
 import os
+import re
 import subprocess
 import signal
+import threading
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
 
 
+# Plain-text usage report, e.g.
+# "Token usage: input=1000, output=500, cache_read=200, cache_creation=50"
+_TOKEN_RE = re.compile(
+    r"input=(\d+),\s*output=(\d+),\s*cache_read=(\d+),\s*cache_creation=(\d+)"
+)
+
+
+# Seconds wait()/terminate() give the drain thread to reach end of output
+# once the process has exited. A grandchild that inherited stdout (e.g. a
+# backgrounded shell or server) keeps the pipe open, so this is bounded.
+DRAIN_TIMEOUT = 2.0
+
+
 class WorkerStatus(Enum):
     """Worker execution status states"""
     PENDING = "pending"
@@ -54,13 +69,24 @@ class Worker:
         # Use current working directory for logs
         self.log_path = Path.cwd() / "logs" / f"{task_id}.log"
 
-        # Token usage tracking
+        # Token usage tracking, accumulated line by line as output arrives
         self._token_usage = {
             "input_tokens": 0,
             "output_tokens": 0,
             "cache_read_tokens": 0,
             "cache_creation_tokens": 0,
         }
+        self._token_lock = threading.Lock()
+        self._drain_thread: Optional[threading.Thread] = None
+
+        # Guards log writes by the drain thread against the log being closed
+        self._log_lock = threading.Lock()
+
+        # Set by the notify_on_exit() watcher once the process has been reaped
+        self._exited: Optional[threading.Event] = None
+
+        # Set by the drain thread whenever token usage changes
+        self._progress_event: Optional[threading.Event] = None
 
     def start(self, command: List[str], cwd: Optional[str] = None) -> None:
         """
@@ -73,7 +99,8 @@ class Worker:
         Side effects:
             - Creates log file at self.log_path
             - Sets self.process, self.pid, and self.status
-            - Begins writing stdout/stderr to log file
+            - Starts a thread copying stdout/stderr to the log file and
+              tallying token usage as lines arrive
         """
         # Ensure logs directory exists
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -81,12 +108,13 @@ class Worker:
         # Open log file for writing
         self.log_file = open(self.log_path, "w", buffering=1)  # Line buffered
 
-        # Spawn subprocess with stdout/stderr redirected to log
+        # Spawn subprocess with stdout/stderr piped back to us
         self.process = subprocess.Popen(
             command,
-            stdout=self.log_file,
+            stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,  # Merge stderr into stdout
             text=True,
+            errors="replace",  # Never let a bad byte stall the drain thread
             bufsize=1,  # Line buffered
             cwd=cwd,  # Set working directory for the subprocess
         )
@@ -94,18 +122,122 @@ class Worker:
         self.pid = self.process.pid
         self.status = WorkerStatus.RUNNING
 
+        self._drain_thread = threading.Thread(
+            target=self._drain_output,
+            name=f"worker-drain-{self.task_id}",
+            daemon=True,
+        )
+        self._drain_thread.start()
+
+    def _drain_output(self) -> None:
+        """Copy subprocess output into the log file, parsing each line once.
+
+        Stops once the log has been closed by _finish_output().
+        """
+        stdout = self.process.stdout
+        for line in stdout:
+            with self._log_lock:
+                if self.log_file.closed:
+                    break
+                self.log_file.write(line)
+            self._parse_token_usage_line(line)
+        stdout.close()
+
+    def _finish_output(self) -> None:
+        """Wait for the drain thread to consume remaining output, then close the log.
+
+        The wait is bounded by DRAIN_TIMEOUT. If output is still open after
+        that, a grandchild is holding the pipe: our end of the pipe is
+        swapped for /dev/null so the pipe is released, and the drain thread
+        exits once its pending read returns.
+        """
+        if self._drain_thread is not None:
+            self._drain_thread.join(DRAIN_TIMEOUT)
+            if self._drain_thread.is_alive():
+                self._release_stdout()
+            self._drain_thread = None
+
+        if hasattr(self, 'log_file') and self.log_file:
+            with self._log_lock:
+                self.log_file.close()
+
+    def _release_stdout(self) -> None:
+        """Drop our reference to the stdout pipe without closing its fd.
+
+        Closing the file object would block on the drain thread's read, and
+        closing the fd directly would leave the file object to close a
+        number that may have been reused. Replacing it with /dev/null does
+        neither, and the drain thread's next read sees end of file.
+        """
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        try:
+            os.dup2(devnull, self.process.stdout.fileno())
+        except (OSError, ValueError):
+            # Already closed by the drain thread
+            pass
+        finally:
+            os.close(devnull)
+
     def is_alive(self) -> bool:
         """
         Check if the worker process is still running.
 
+        Once notify_on_exit() is watching the process, this reads the
+        watcher's flag instead of polling, so checking many workers each
+        tick costs no waitpid() calls.
+
         Returns:
             True if process is running, False if it has exited
         """
         if self.process is None:
             return False
 
+        if self._exited is not None:
+            return not self._exited.is_set()
+
         return self.process.poll() is None
 
+    def notify_on_exit(self, event: threading.Event) -> None:
+        """
+        Set an event as soon as the worker process exits.
+
+        Lets callers block on the event instead of polling is_alive() on a
+        fixed interval. The process is waited on from a daemon thread, so
+        is_alive()/wait() keep working as usual.
+
+        Args:
+            event: Event to set when the process exits
+        """
+        if self.process is None:
+            raise RuntimeError("Cannot watch a worker that hasn't been started")
+
+        process = self.process
+        exited = threading.Event()
+
+        def _wait_for_exit():
+            process.wait()
+            exited.set()
+            event.set()
+
+        threading.Thread(
+            target=_wait_for_exit,
+            name=f"worker-exit-{self.task_id}",
+            daemon=True,
+        ).start()
+        self._exited = exited
+
+    def notify_on_progress(self, event: threading.Event) -> None:
+        """
+        Set an event whenever the worker reports new token usage.
+
+        Output is already read as it arrives by the drain thread, so callers
+        can block on the event instead of polling get_token_usage().
+
+        Args:
+            event: Event to set each time token usage changes
+        """
+        self._progress_event = event
+
     def get_exit_code(self) -> Optional[int]:
         """
         Get the exit code of the process.
@@ -130,18 +262,15 @@ class Worker:
 
         Side effects:
             - Updates self.status based on exit code
-            - Closes log file
-            - Parses token usage from logs
+            - Flushes remaining output and closes log file
         """
         if self.process is None:
             raise RuntimeError("Cannot wait on worker that hasn't been started")
 
-        try:
-            exit_code = self.process.wait(timeout=timeout)
-        finally:
-            # Ensure log file is closed
-            if hasattr(self, 'log_file') and self.log_file:
-                self.log_file.close()
+        exit_code = self.process.wait(timeout=timeout)
+
+        # All output (and therefore token usage) is in once the drain finishes
+        self._finish_output()
 
         # Update status based on exit code
         if exit_code == 0:
@@ -149,9 +278,6 @@ class Worker:
         else:
             self.status = WorkerStatus.FAILED
 
-        # Parse token usage from logs
-        self._parse_token_usage_from_log()
-
         return exit_code
 
     def terminate(self) -> None:
@@ -175,27 +301,26 @@ class Worker:
 
         self.status = WorkerStatus.FAILED
 
-        # Close log file
-        if hasattr(self, 'log_file') and self.log_file:
-            self.log_file.close()
+        # Flush remaining output and close log file
+        self._finish_output()
 
     def get_token_usage(self) -> Dict[str, int]:
         """
         Get accumulated token usage metrics.
 
+        Usage is tallied as output arrives, so this is cheap to call while
+        the worker is still running.
+
         Returns:
             Dictionary with keys: input_tokens, output_tokens,
             cache_read_tokens, cache_creation_tokens
         """
-        # If process is still running or just finished, parse latest usage
-        if self.log_path.exists():
-            self._parse_token_usage_from_log()
+        with self._token_lock:
+            return self._token_usage.copy()
 
-        return self._token_usage.copy()
-
-    def _parse_token_usage_from_log(self) -> None:
+    def _parse_token_usage_line(self, line: str) -> None:
         """
-        Parse token usage from Claude Code JSON output in log file.
+        Add any token usage reported on one line of Claude Code output.
 
         Claude Code with --output-format json outputs a JSON object containing:
         {
@@ -208,59 +333,66 @@ class Worker:
           "modelUsage": { ... }
         }
 
-        Updates self._token_usage with accumulated totals from all JSON responses.
+        Plain-text "Token usage: input=..., output=..., cache_read=...,
+        cache_creation=..." lines are also counted. Other lines (e.g., error
+        messages, partial output) are ignored.
         """
-        if not self.log_path.exists():
+        if not line.lstrip().startswith("{"):
+            match = _TOKEN_RE.search(line)
+            if match:
+                with self._token_lock:
+                    self._token_usage["input_tokens"] += int(match.group(1))
+                    self._token_usage["output_tokens"] += int(match.group(2))
+                    self._token_usage["cache_read_tokens"] += int(match.group(3))
+                    self._token_usage["cache_creation_tokens"] += int(match.group(4))
+                self._report_progress()
+            return
+
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return
+
+        if not isinstance(data, dict):
             return
 
-        # Reset counters
-        totals = {
+        found = {
             "input_tokens": 0,
             "output_tokens": 0,
             "cache_read_tokens": 0,
             "cache_creation_tokens": 0,
         }
 
-        # Read log file and parse JSON output
-        try:
-            with open(self.log_path, "r") as f:
-                content = f.read()
-
-                # Claude Code outputs JSON on a single line
-                # Try to parse each line as JSON
-                for line in content.splitlines():
-                    if not line.strip():
-                        continue
-
-                    try:
-                        data = json.loads(line)
-
-                        # Extract from 'usage' field if present
-                        if "usage" in data:
-                            usage = data["usage"]
-                            totals["input_tokens"] += usage.get("input_tokens", 0)
-                            totals["output_tokens"] += usage.get("output_tokens", 0)
-                            totals["cache_read_tokens"] += usage.get("cache_read_input_tokens", 0)
-                            totals["cache_creation_tokens"] += usage.get("cache_creation_input_tokens", 0)
-
-                        # Alternatively, extract from modelUsage (more detailed)
-                        # This provides per-model breakdown if using multiple models
-                        elif "modelUsage" in data:
-                            for _, model_usage in data["modelUsage"].items():
-                                totals["input_tokens"] += model_usage.get("inputTokens", 0)
-                                totals["output_tokens"] += model_usage.get("outputTokens", 0)
-                                totals["cache_read_tokens"] += model_usage.get("cacheReadInputTokens", 0)
-                                totals["cache_creation_tokens"] += model_usage.get("cacheCreationInputTokens", 0)
-
-                    except json.JSONDecodeError:
-                        # Skip non-JSON lines (e.g., error messages, partial output)
-                        continue
-
-        except IOError:
-            # If we can't read the log, keep existing token counts
-            pass
+        # Extract from 'usage' field if present
+        if "usage" in data:
+            usage = data["usage"]
+            found["input_tokens"] += usage.get("input_tokens", 0)
+            found["output_tokens"] += usage.get("output_tokens", 0)
+            found["cache_read_tokens"] += usage.get("cache_read_input_tokens", 0)
+            found["cache_creation_tokens"] += usage.get("cache_creation_input_tokens", 0)
+
+        # Alternatively, extract from modelUsage (more detailed)
+        # This provides per-model breakdown if using multiple models
+        elif "modelUsage" in data:
+            for _, model_usage in data["modelUsage"].items():
+                found["input_tokens"] += model_usage.get("inputTokens", 0)
+                found["output_tokens"] += model_usage.get("outputTokens", 0)
+                found["cache_read_tokens"] += model_usage.get("cacheReadInputTokens", 0)
+                found["cache_creation_tokens"] += model_usage.get("cacheCreationInputTokens", 0)
+
+        else:
+            return
+
+        with self._token_lock:
+            for key, value in found.items():
+                self._token_usage[key] += value
+        self._report_progress()
 
-        self._token_usage = totals
+    def _report_progress(self) -> None:
+        """Signal notify_on_progress() listeners that token usage changed."""
+        event = self._progress_event
+        if event is not None:
+            event.set()
 
     def get_status_dict(self) -> Dict:
         """
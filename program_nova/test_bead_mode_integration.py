@@ -242,6 +242,9 @@ class TestBeadModeIntegration:
 
             orch.start_worker(task_id)
 
+            # The in_progress update runs in the background; wait for it
+            orch.flush_writes()
+
             # Verify task is marked as in_progress
             result = subprocess.run(
                 ["bd", "show", task_id, "--json"],
@@ -282,11 +285,14 @@ class TestBeadModeIntegration:
         }
 
         # Record start time
-        orch.task_start_times[task_id] = time.time()
+        start_time = time.time()
         time.sleep(1.1)  # Delay to measure duration (duration is stored as int seconds)
 
         # Complete the task
-        orch.complete_task(task_id, mock_worker)
+        orch.complete_task(task_id, mock_worker, start_time)
+
+        # The comment and close run in the background; wait for them
+        orch.flush_writes()
 
         # Verify task was closed
         result = subprocess.run(
@@ -449,9 +455,10 @@ class TestBeadModeIntegration:
             orch.start_worker(task_id)
 
             # Worker should be created
-            assert task_id in orch.active_workers
+            assert task_id in orch.active
 
-            # Cleanup
+            # Cleanup, once the background in_progress update has landed
+            orch.flush_writes()
             subprocess.run(["bd", "update", task_id, "--status=open"], check=True)
 
 